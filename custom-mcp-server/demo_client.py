@@ -10,23 +10,53 @@ and DELETE operations with clear output formatting and user interaction.
 import asyncio
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import time
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from mcp_client import MCPClient
 
 
+# Collections shown by the demonstration, in display order
+_COLLECTIONS = ("users", "tasks", "products")
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2)
+
+
 class MCPDemonstrationClient:
     """
     Comprehensive demonstration client that showcases all MCP server capabilities
     with interactive prompts and detailed progress reporting.
     """
     
+    # Symbols shown before each progress message, keyed by status
+    _STATUS_SYMBOLS = {
+        "INFO": "ℹ",
+        "SUCCESS": "✓",
+        "WARNING": "⚠",
+        "ERROR": "✗",
+        "PROGRESS": "→"
+    }
+    
     def __init__(self):
         """Initialize the demonstration client."""
         self.server_command = [
@@ -35,48 +65,115 @@ class MCPDemonstrationClient:
         ]
         self.client = MCPClient(self.server_command, max_retries=3, retry_delay=2.0)
         self.logger = logging.getLogger(__name__)
+        # Timestamp of the last progress line, reformatted only when the second changes
+        self._last_sec = -1
+        self._last_stamp = ""
         self._setup_logging()
     
     def _setup_logging(self) -> None:
-        """Configure logging for the demonstration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('demo_client.log')
-            ]
+        """
+        Configure logging for the demonstration.
+        
+        Log calls only enqueue the record; a background listener thread
+        writes it to stdout and demo_client.log.
+        """
+        self._log_queue_handler = None
+        self._log_listener = None
+        
+        root_logger = logging.getLogger()
+        if root_logger.handlers:
+            # Logging was already configured by the caller
+            return
+        
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = (
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler('demo_client.log', delay=True)
         )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        self._log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(self._log_queue_handler)
+        root_logger.setLevel(logging.INFO)
+        
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+    
+    def _stop_logging(self) -> None:
+        """Flush queued log records and attach the handlers directly to the root logger."""
+        if self._log_listener is None:
+            return
+        
+        self._log_listener.stop()
+        
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._log_queue_handler)
+        for handler in self._log_listener.handlers:
+            root_logger.addHandler(handler)
+        
+        self._log_queue_handler = None
+        self._log_listener = None
     
     def print_banner(self, title: str, width: int = 80) -> None:
         """Print a formatted banner for section headers."""
-        print("\n" + "=" * width)
-        print(f" {title.center(width - 2)} ")
-        print("=" * width + "\n")
+        bar = "=" * width
+        sys.stdout.write(f"\n{bar}\n {title.center(width - 2)} \n{bar}\n\n")
     
     def print_section(self, title: str, width: int = 60) -> None:
         """Print a formatted section header."""
-        print("\n" + "-" * width)
-        print(f" {title} ")
-        print("-" * width)
+        bar = "-" * width
+        sys.stdout.write(f"\n{bar}\n {title} \n{bar}\n")
     
     def print_progress(self, message: str, status: str = "INFO") -> None:
         """Print a progress message with timestamp."""
-        timestamp = time.strftime("%H:%M:%S")
-        status_symbols = {
-            "INFO": "ℹ",
-            "SUCCESS": "✓",
-            "WARNING": "⚠",
-            "ERROR": "✗",
-            "PROGRESS": "→"
-        }
-        symbol = status_symbols.get(status, "•")
-        print(f"[{timestamp}] {symbol} {message}")
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_stamp = time.strftime("%H:%M:%S", time.localtime(sec))
+        symbol = self._STATUS_SYMBOLS.get(status, "•")
+        print(f"[{self._last_stamp}] {symbol} {message}")
+    
+    async def _read_input(self, prompt: str) -> str:
+        """
+        Read a line from stdin while the event loop keeps running.
+        
+        On a terminal whose file descriptor the loop's selector can watch, the
+        loop waits for the line to be entered and then reads it, so no thread
+        is ever left blocked on stdin. Elsewhere (piped input, or the Windows
+        proactor loop) this falls back to a blocking input() call.
+        """
+        loop = asyncio.get_running_loop()
+        if not sys.stdin.isatty():
+            return input(prompt)
+        
+        fd = sys.stdin.fileno()
+        ready = loop.create_future()
+        try:
+            loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        except NotImplementedError:
+            return input(prompt)
+        
+        try:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            await ready
+        finally:
+            loop.remove_reader(fd)
+        
+        # A terminal in canonical mode hands over one entered line per read
+        line = os.read(fd, 65536)
+        if not line:
+            raise EOFError
+        return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r\n")
     
-    def wait_for_user_input(self, prompt: str = "Press Enter to continue", allow_skip: bool = True) -> bool:
+    async def wait_for_user_input(self, prompt: str = "Press Enter to continue", allow_skip: bool = True) -> bool:
         """
         Wait for user input with option to skip or continue.
         
+        The MCP server's stdio pipes keep being serviced while waiting.
+        
         Args:
             prompt: The prompt message to display
             allow_skip: Whether to allow skipping with 's'
@@ -90,74 +187,90 @@ class MCPDemonstrationClient:
             full_prompt = f"{prompt}: "
         
         try:
-            user_input = input(full_prompt).strip().lower()
+            user_input = (await self._read_input(full_prompt)).strip().lower()
             if allow_skip and user_input == 's':
                 return False
             return True
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # asyncio.run turns Ctrl+C into cancelling the awaited prompt
             print("\n\nDemonstration interrupted by user.")
             sys.exit(0)
     
     def format_json_output(self, data: Any, max_items: int = 5) -> str:
         """Format JSON data for readable output."""
         if isinstance(data, list) and len(data) > max_items:
-            # Show first few items and indicate there are more
-            formatted_items = data[:max_items]
-            return json.dumps(formatted_items, indent=2) + f"\n... and {len(data) - max_items} more items"
+            # Only serialize the items that are shown and indicate there are more
+            return _dumps_indented(data[:max_items]) + f"\n... and {len(data) - max_items} more items"
         else:
-            return json.dumps(data, indent=2)
+            return _dumps_indented(data)
     
-    def display_operation_summary(self, operation_name: str, results: Dict[str, Any]) -> None:
-        """Display a summary of operation results."""
-        self.print_section(f"{operation_name} Operation Summary")
+    def _report_total(self, total: int, action: str) -> None:
+        """Report the number of records an operation affected."""
+        self.print_progress(f"Total records {action}: {total}", "SUCCESS" if total > 0 else "WARNING")
+    
+    def _summarize_insert(self, summary: Dict[str, Any], results: Dict[str, Any]) -> None:
+        """Display the INSERT summary, including the first few errors."""
+        errors = summary.get("errors", [])
         
-        summary = results.get("summary", {})
+        self._report_total(summary.get("total_created", 0), "created")
         
-        if operation_name == "INSERT":
-            total_created = summary.get("total_created", 0)
-            errors = summary.get("errors", [])
-            
-            self.print_progress(f"Total records created: {total_created}", "SUCCESS" if total_created > 0 else "WARNING")
-            
-            if errors:
-                self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
-                for error in errors[:3]:  # Show first 3 errors
-                    print(f"    • {error}")
-                if len(errors) > 3:
-                    print(f"    ... and {len(errors) - 3} more errors")
+        if errors:
+            self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
+            for error in errors[:3]:  # Show first 3 errors
+                print(f"    • {error}")
+            if len(errors) > 3:
+                print(f"    ... and {len(errors) - 3} more errors")
+    
+    def _summarize_fetch(self, summary: Dict[str, Any], results: Dict[str, Any]) -> None:
+        """Display the FETCH summary with a breakdown by collection."""
+        errors = summary.get("errors", [])
         
-        elif operation_name == "FETCH":
-            total_records = summary.get("total_records", 0)
-            errors = summary.get("errors", [])
-            
-            self.print_progress(f"Total records fetched: {total_records}", "SUCCESS" if total_records > 0 else "WARNING")
-            
-            # Show breakdown by collection
-            for collection in ["users", "tasks", "products"]:
-                if collection in results:
-                    count = results[collection].get("count", 0)
-                    self.print_progress(f"  {collection.capitalize()}: {count} records", "INFO")
-            
-            if errors:
-                self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
+        self._report_total(summary.get("total_records", 0), "fetched")
         
-        elif operation_name == "UPDATE":
-            total_updated = summary.get("total_updated", 0)
-            errors = summary.get("errors", [])
-            
-            self.print_progress(f"Total records updated: {total_updated}", "SUCCESS" if total_updated > 0 else "WARNING")
-            
-            if errors:
-                self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
+        # Show breakdown by collection
+        for collection in _COLLECTIONS:
+            collection_results = results.get(collection)
+            if collection_results is None:
+                continue
+            count = collection_results.get("count", 0)
+            self.print_progress(f"  {collection.capitalize()}: {count} records", "INFO")
         
-        elif operation_name == "DELETE":
-            total_deleted = summary.get("total_deleted", 0)
-            errors = summary.get("errors", [])
-            
-            self.print_progress(f"Total records deleted: {total_deleted}", "SUCCESS" if total_deleted > 0 else "WARNING")
-            
-            if errors:
-                self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
+        if errors:
+            self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
+    
+    def _summarize_update(self, summary: Dict[str, Any], results: Dict[str, Any]) -> None:
+        """Display the UPDATE summary."""
+        errors = summary.get("errors", [])
+        
+        self._report_total(summary.get("total_updated", 0), "updated")
+        
+        if errors:
+            self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
+    
+    def _summarize_delete(self, summary: Dict[str, Any], results: Dict[str, Any]) -> None:
+        """Display the DELETE summary."""
+        errors = summary.get("errors", [])
+        
+        self._report_total(summary.get("total_deleted", 0), "deleted")
+        
+        if errors:
+            self.print_progress(f"Errors encountered: {len(errors)}", "WARNING")
+    
+    # Summary display for each operation, keyed by operation name
+    _SUMMARY_HANDLERS = {
+        "INSERT": _summarize_insert,
+        "FETCH": _summarize_fetch,
+        "UPDATE": _summarize_update,
+        "DELETE": _summarize_delete
+    }
+    
+    def display_operation_summary(self, operation_name: str, results: Dict[str, Any]) -> None:
+        """Display a summary of operation results."""
+        self.print_section(f"{operation_name} Operation Summary")
+        
+        handler = self._SUMMARY_HANDLERS.get(operation_name)
+        if handler is not None:
+            handler(self, results.get("summary", {}), results)
     
     async def run_demonstration(self) -> None:
         """Run the complete CRUD demonstration."""
@@ -170,7 +283,7 @@ class MCPDemonstrationClient:
         print("• DELETE: Remove records with confirmation")
         print("\nEach operation can be skipped if desired.")
         
-        if not self.wait_for_user_input("\nReady to start the demonstration?", allow_skip=False):
+        if not await self.wait_for_user_input("\nReady to start the demonstration?", allow_skip=False):
             return
         
         try:
@@ -190,7 +303,7 @@ class MCPDemonstrationClient:
                     return
                 
                 # Run INSERT operations
-                if self.wait_for_user_input("\nProceed with INSERT operations?"):
+                if await self.wait_for_user_input("\nProceed with INSERT operations?"):
                     self.print_section("INSERT Operations - Creating New Records")
                     self.print_progress("Starting INSERT operations...", "PROGRESS")
                     
@@ -200,9 +313,10 @@ class MCPDemonstrationClient:
                     # Show some sample created records
                     if insert_results["summary"]["total_created"] > 0:
                         print("\nSample created records:")
-                        for collection in ["users", "tasks", "products"]:
-                            if insert_results[collection]:
-                                for result in insert_results[collection][:2]:  # Show first 2
+                        for collection in _COLLECTIONS:
+                            created = insert_results.get(collection)
+                            if created:
+                                for result in created[:2]:  # Show first 2
                                     if result.get("success") and result.get("data"):
                                         record = result["data"]
                                         record_id = record.get("id", "unknown")
@@ -219,7 +333,7 @@ class MCPDemonstrationClient:
                     self.print_progress("INSERT operations skipped by user", "WARNING")
                 
                 # Run FETCH operations
-                if self.wait_for_user_input("\nProceed with FETCH operations?"):
+                if await self.wait_for_user_input("\nProceed with FETCH operations?"):
                     self.print_section("FETCH Operations - Retrieving All Records")
                     self.print_progress("Starting FETCH operations...", "PROGRESS")
                     
@@ -228,12 +342,14 @@ class MCPDemonstrationClient:
                     
                     # Show detailed records if requested
                     if fetch_results["summary"]["total_records"] > 0:
-                        if self.wait_for_user_input("Would you like to see detailed record listings?"):
-                            for collection in ["users", "tasks", "products"]:
-                                if collection in fetch_results and fetch_results[collection]["records"]:
+                        if await self.wait_for_user_input("Would you like to see detailed record listings?"):
+                            for collection in _COLLECTIONS:
+                                collection_results = fetch_results.get(collection)
+                                records = collection_results["records"] if collection_results is not None else None
+                                if records:
                                     print(f"\n{collection.capitalize()} Records:")
-                                    records = fetch_results[collection]["records"]
-                                    for i, record in enumerate(records[:5]):  # Show first 5
+                                    shown = records[:5]  # Show first 5
+                                    for i, record in enumerate(shown):
                                         print(f"  {i+1}. {self.format_json_output(record)}")
                                     if len(records) > 5:
                                         print(f"  ... and {len(records) - 5} more records")
@@ -241,7 +357,7 @@ class MCPDemonstrationClient:
                     self.print_progress("FETCH operations skipped by user", "WARNING")
                 
                 # Run UPDATE operations
-                if self.wait_for_user_input("\nProceed with UPDATE operations?"):
+                if await self.wait_for_user_input("\nProceed with UPDATE operations?"):
                     self.print_section("UPDATE Operations - Modifying Existing Records")
                     self.print_progress("Starting UPDATE operations...", "PROGRESS")
                     
@@ -250,7 +366,7 @@ class MCPDemonstrationClient:
                     
                     # Show before/after comparisons
                     if update_results["summary"]["total_updated"] > 0:
-                        if self.wait_for_user_input("Would you like to see before/after comparisons?"):
+                        if await self.wait_for_user_input("Would you like to see before/after comparisons?"):
                             for update_op in update_results["updates"]:
                                 if update_op["before_records"] and update_op["after_records"]:
                                     print(f"\nUpdate: {update_op['description']}")
@@ -262,7 +378,7 @@ class MCPDemonstrationClient:
                     self.print_progress("UPDATE operations skipped by user", "WARNING")
                 
                 # Run DELETE operations
-                if self.wait_for_user_input("\nProceed with DELETE operations? (This will remove records)"):
+                if await self.wait_for_user_input("\nProceed with DELETE operations? (This will remove records)"):
                     self.print_section("DELETE Operations - Removing Records")
                     self.print_progress("Starting DELETE operations...", "PROGRESS")
                     
@@ -299,6 +415,8 @@ class MCPDemonstrationClient:
             self.print_progress(f"Demonstration failed: {str(e)}", "ERROR")
             self.logger.error(f"Demonstration error: {str(e)}")
             raise
+        finally:
+            self._stop_logging()
     
     async def run_quick_test(self) -> bool:
         """
@@ -309,41 +427,49 @@ class MCPDemonstrationClient:
         """
         print("Running quick test of all CRUD operations...")
         
+        # Per-operation results are collected and written in one go; the
+        # final pass/fail line is printed so it is flushed either way
+        out = []
+        
         try:
             async with self.client.connection():
                 # Test connection
                 if not await self.client.test_connection():
                     print("✗ Connection test failed")
                     return False
-                print("✓ Connection test passed")
+                out.append("✓ Connection test passed\n")
                 
                 # Test INSERT
                 insert_results = await self.client.demonstrate_insert_operations()
                 insert_success = insert_results["summary"]["total_created"] > 0
-                print(f"{'✓' if insert_success else '✗'} INSERT operations: {insert_results['summary']['total_created']} records created")
+                out.append(f"{'✓' if insert_success else '✗'} INSERT operations: {insert_results['summary']['total_created']} records created\n")
                 
                 # Test FETCH
                 fetch_results = await self.client.demonstrate_fetch_operations()
                 fetch_success = fetch_results["summary"]["total_records"] > 0
-                print(f"{'✓' if fetch_success else '✗'} FETCH operations: {fetch_results['summary']['total_records']} records retrieved")
+                out.append(f"{'✓' if fetch_success else '✗'} FETCH operations: {fetch_results['summary']['total_records']} records retrieved\n")
                 
                 # Test UPDATE
                 update_results = await self.client.demonstrate_update_operations()
                 update_success = len(update_results["summary"]["errors"]) == 0
-                print(f"{'✓' if update_success else '✗'} UPDATE operations: {update_results['summary']['total_updated']} records updated")
+                out.append(f"{'✓' if update_success else '✗'} UPDATE operations: {update_results['summary']['total_updated']} records updated\n")
                 
                 # Test DELETE
                 delete_results = await self.client.demonstrate_delete_operations()
                 delete_success = len(delete_results["summary"]["errors"]) == 0
-                print(f"{'✓' if delete_success else '✗'} DELETE operations: {delete_results['summary']['total_deleted']} records deleted")
+                out.append(f"{'✓' if delete_success else '✗'} DELETE operations: {delete_results['summary']['total_deleted']} records deleted\n")
                 
                 overall_success = insert_success and fetch_success and update_success and delete_success
+                sys.stdout.write("".join(out))
                 print(f"\n{'✓ All tests passed!' if overall_success else '✗ Some tests failed'}")
                 return overall_success
                 
         except Exception as e:
+            sys.stdout.write("".join(out))
             print(f"✗ Quick test failed: {str(e)}")
             return False
+        finally:
+            self._stop_logging()
 
 
 async def main():
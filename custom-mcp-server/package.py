@@ -5,231 +5,101 @@ This script creates a complete, distributable package of the project.
 """
 
 import os
+import re
 import sys
 import shutil
+import fnmatch
 import zipfile
 import json
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Output is queued and written with one call per packaging phase rather than
+# one write per line
+_output_lines = []
+
+
+def emit(line: str = "") -> None:
+    """Queue a line of output until the next flush_output() call."""
+    _output_lines.append(line + "\n")
+
+
+def flush_output() -> None:
+    """Write all queued output in a single call and flush stdout."""
+    if _output_lines:
+        sys.stdout.write("".join(_output_lines))
+        _output_lines.clear()
+    sys.stdout.flush()
 
 
 def print_banner(title: str, width: int = 60) -> None:
     """Print a formatted banner."""
-    print("\n" + "=" * width)
-    print(f" {title.center(width - 2)} ")
-    print("=" * width + "\n")
+    emit("\n" + "=" * width)
+    emit(f" {title.center(width - 2)} ")
+    emit("=" * width + "\n")
+
+
+# Symbols shown before each step message, keyed by status
+_STATUS_SYMBOLS = {
+    "INFO": "ℹ",
+    "SUCCESS": "✓",
+    "WARNING": "⚠",
+    "ERROR": "✗",
+    "PROGRESS": "→"
+}
 
 
 def print_step(step: str, status: str = "INFO") -> None:
     """Print a packaging step with status."""
-    status_symbols = {
-        "INFO": "ℹ",
-        "SUCCESS": "✓",
-        "WARNING": "⚠",
-        "ERROR": "✗",
-        "PROGRESS": "→"
+    symbol = _STATUS_SYMBOLS.get(status, "•")
+    emit(f"{symbol} {step}")
+
+
+# Package information that does not change between calls
+_PACKAGE_INFO_TEMPLATE = {
+    "name": "custom-mcp-server",
+    "version": "1.0.0",
+    "description": "A custom Model Context Protocol server with NoSQL database integration",
+    "python_version": "{}.{}.{}".format(*sys.version_info[:3]),
+    "platform": sys.platform,
+    "components": {
+        "server": "MCP server with CRUD operations",
+        "client": "Demonstration client with interactive features",
+        "database": "TinyDB NoSQL database with sample data",
+        "tests": "Comprehensive test suite",
+        "documentation": "Complete setup and API documentation"
+    },
+    "entry_points": {
+        "server": "run_server.py",
+        "client": "demo_client.py",
+        "setup": "setup.py"
     }
-    symbol = status_symbols.get(status, "•")
-    print(f"{symbol} {step}")
+}
 
 
 def create_package_info() -> dict:
     """Create package information."""
     return {
-        "name": "custom-mcp-server",
-        "version": "1.0.0",
-        "description": "A custom Model Context Protocol server with NoSQL database integration",
-        "created": datetime.now().isoformat(),
-        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-        "platform": sys.platform,
-        "components": {
-            "server": "MCP server with CRUD operations",
-            "client": "Demonstration client with interactive features",
-            "database": "TinyDB NoSQL database with sample data",
-            "tests": "Comprehensive test suite",
-            "documentation": "Complete setup and API documentation"
-        },
-        "entry_points": {
-            "server": "run_server.py",
-            "client": "demo_client.py",
-            "setup": "setup.py"
-        }
+        **_PACKAGE_INFO_TEMPLATE,
+        "created": datetime.now().isoformat()
     }
 
 
-def get_files_to_package() -> list:
-    """Get list of files to include in the package."""
-    include_patterns = [
-        # Source code
-        "src/**/*.py",
-        
-        # Main entry points
-        "run_server.py",
-        "demo_client.py",
-        "setup.py",
-        "package.py",
-        
-        # Configuration files
-        "requirements.txt",
-        "pyproject.toml",
-        "config.json",
-        "pytest.ini",
-        
-        # Documentation
-        "README.md",
-        "API_DOCUMENTATION.md",
-        "DEMO_CLIENT_README.md",
-        
-        # Tests
-        "tests/**/*.py",
-        
-        # Startup scripts
-        "start_server.bat",
-        "start_client.bat",
-        "start_server.sh",
-        "start_client.sh",
-        
-        # Git and project files
-        ".gitignore",
-        
-        # Data directory structure (but not actual data files)
-        "data/.gitkeep"
-    ]
-    
-    exclude_patterns = [
-        "__pycache__",
-        "*.pyc",
-        "*.pyo",
-        "*.log",
-        ".pytest_cache",
-        "venv",
-        "env",
-        ".env",
-        "data/*.json",  # Exclude actual database files
-        "data/*.db",
-        "logs",
-        ".vscode",
-        ".idea"
-    ]
-    
-    files = []
-    base_path = Path(".")
-    
-    # Add files based on include patterns
-    for pattern in include_patterns:
-        if "**" in pattern:
-            # Recursive pattern
-            parts = pattern.split("**")
-            base_dir = parts[0].rstrip("/")
-            file_pattern = parts[1].lstrip("/")
-            
-            if base_dir:
-                search_path = base_path / base_dir
-            else:
-                search_path = base_path
-            
-            if search_path.exists():
-                if file_pattern:
-                    files.extend(search_path.rglob(file_pattern))
-                else:
-                    files.extend(search_path.rglob("*"))
-        else:
-            # Simple pattern
-            matching_files = list(base_path.glob(pattern))
-            files.extend(matching_files)
-    
-    # Filter out excluded patterns
-    filtered_files = []
-    for file_path in files:
-        if file_path.is_file():
-            relative_path = file_path.relative_to(base_path)
-            should_exclude = False
-            
-            for exclude_pattern in exclude_patterns:
-                if exclude_pattern in str(relative_path):
-                    should_exclude = True
-                    break
-            
-            if not should_exclude:
-                filtered_files.append(relative_path)
-    
-    return sorted(set(filtered_files))
-
-
-def create_package_directory(package_name: str) -> Path:
-    """Create a temporary package directory."""
-    package_dir = Path(f"dist/{package_name}")
-    
-    # Remove existing package directory
-    if package_dir.exists():
-        shutil.rmtree(package_dir)
-    
-    # Create new package directory
-    package_dir.mkdir(parents=True, exist_ok=True)
-    
-    return package_dir
-
-
-def copy_files_to_package(files: list, package_dir: Path) -> bool:
-    """Copy files to the package directory."""
-    try:
-        for file_path in files:
-            source = Path(file_path)
-            destination = package_dir / file_path
-            
-            # Create parent directories
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy file
-            shutil.copy2(source, destination)
-            
-        print_step(f"Copied {len(files)} files to package directory", "SUCCESS")
-        return True
-        
-    except Exception as e:
-        print_step(f"Failed to copy files: {e}", "ERROR")
-        return False
-
-
-def create_package_manifest(package_dir: Path, files: list, package_info: dict) -> bool:
-    """Create a package manifest file."""
-    try:
-        manifest = {
-            "package_info": package_info,
-            "files": [str(f) for f in files],
-            "file_count": len(files),
-            "installation_instructions": [
-                "1. Extract the package to your desired location",
-                "2. Navigate to the extracted directory",
-                "3. Run: python setup.py",
-                "4. Follow the setup instructions",
-                "5. Start the server: python run_server.py",
-                "6. Run the demo: python demo_client.py"
-            ],
-            "requirements": [
-                "Python 3.8 or higher",
-                "pip package manager",
-                "At least 100MB free disk space",
-                "Internet connection for initial setup"
-            ]
-        }
-        
-        manifest_path = package_dir / "PACKAGE_MANIFEST.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-        
-        print_step("Created package manifest", "SUCCESS")
-        return True
-        
-    except Exception as e:
-        print_step(f"Failed to create manifest: {e}", "ERROR")
-        return False
+# Deflate level for archives; source text compresses well even at level 1
+ARCHIVE_COMPRESSLEVEL = 1
 
+# Files smaller than this are stored uncompressed since deflate overhead
+# outweighs the savings
+ZIP_STORE_THRESHOLD = 512
 
-def create_quick_start_guide(package_dir: Path) -> bool:
-    """Create a quick start guide for the package."""
-    try:
-        quick_start = """# Custom MCP Server - Quick Start Guide
+QUICK_START_GUIDE = """# Custom MCP Server - Quick Start Guide
 
 ## What's Included
 
@@ -311,29 +181,363 @@ After the demo works:
 
 Enjoy exploring the Custom MCP Server!
 """
+
+# Encoded once so every archive writes the same bytes without re-encoding
+_QUICK_START_MD = QUICK_START_GUIDE.encode("utf-8")
+
+
+# Directories that are never descended into while scanning for package files
+EXCLUDE_DIRS = frozenset({
+    "__pycache__",
+    ".pytest_cache",
+    "venv",
+    "env",
+    ".env",
+    "logs",
+    ".vscode",
+    ".idea"
+})
+
+# File suffixes that are never packaged
+EXCLUDE_SUFFIXES = (".pyc", ".pyo", ".log")
+
+
+def _is_glob(pattern: str) -> bool:
+    """Return True if the pattern contains glob wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+def _split_pattern(pattern: str) -> tuple:
+    """Split an include pattern into a (literal path, suffix glob) pair."""
+    if "**" in pattern:
+        prefix, _, suffix = pattern.partition("**")
+        return prefix.rstrip("/"), suffix.lstrip("/") or "*"
+    return pattern, None
+
+
+def _compile_include_regex(patterns: list) -> re.Pattern:
+    """Compile all include patterns into a single union regex."""
+    alternatives = []
+    for pattern in patterns:
+        literal, suffix = _split_pattern(pattern)
+        if suffix is None:
+            alternatives.append(fnmatch.translate(literal))
+        elif literal:
+            alternatives.append(re.escape(literal + "/") + fnmatch.translate(suffix))
+        else:
+            alternatives.append(fnmatch.translate(suffix))
+    return re.compile("|".join(f"(?:{alt})" for alt in alternatives))
+
+
+def _walk(base: str):
+    """
+    Yield the paths of all files below base using an iterative scandir walk.
+    
+    Excluded directories are pruned before they are pushed onto the stack, so
+    nothing below them is ever scanned. Entries are sorted per directory and
+    subdirectories are visited in name order, so the output order is stable
+    without sorting the full result.
+    """
+    stack = [base]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
         
-        quick_start_path = package_dir / "QUICK_START.md"
-        with open(quick_start_path, 'w') as f:
-            f.write(quick_start)
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDE_DIRS:
+                    subdirectories.append(entry.path)
+            elif entry.name.endswith(EXCLUDE_SUFFIXES):
+                continue
+            elif entry.is_file():
+                yield entry.path
         
-        print_step("Created quick start guide", "SUCCESS")
+        stack.extend(reversed(subdirectories))
+
+
+def _find_literal_files(paths: list) -> set:
+    """
+    Return the literal include paths that exist as files.
+    
+    Paths are grouped by parent directory and each directory is read once with
+    scandir, so existence comes from DirEntry.is_file() instead of one stat()
+    call per path.
+    """
+    names_by_parent = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        names_by_parent.setdefault(parent, set()).add(name)
+    
+    found = set()
+    for parent, names in names_by_parent.items():
+        try:
+            with os.scandir(parent or ".") as entries:
+                for entry in entries:
+                    if entry.name in names and entry.is_file():
+                        found.add(f"{parent}/{entry.name}" if parent else entry.name)
+        except OSError:
+            continue
+    return found
+
+
+# Files and globs included in the package, relative to the project root
+INCLUDE_PATTERNS = [
+    # Source code
+    "src/**/*.py",
+    "src/database/sample_data.json",
+    
+    # Main entry points
+    "run_server.py",
+    "demo_client.py",
+    "setup.py",
+    "package.py",
+    
+    # Configuration files
+    "requirements.txt",
+    "pyproject.toml",
+    "config.json",
+    "pytest.ini",
+    
+    # Documentation
+    "README.md",
+    "API_DOCUMENTATION.md",
+    "DEMO_CLIENT_README.md",
+    
+    # Tests
+    "tests/**/*.py",
+    
+    # Startup scripts
+    "start_server.bat",
+    "start_client.bat",
+    "start_server.sh",
+    "start_client.sh",
+    
+    # Git and project files
+    ".gitignore",
+    
+    # Data directory structure (but not actual data files)
+    "data/.gitkeep"
+]
+
+# Files matching these globs are dropped even if an include pattern matched
+EXCLUDE_PATTERNS = [
+    "data/*.json",  # Exclude actual database files
+    "data/*.db"
+]
+
+
+def _walk_roots(patterns: list) -> list:
+    """
+    Return the directories a walk must cover to match the given globs.
+    
+    Each glob contributes its leading directory segments that contain no
+    wildcards; roots nested inside another root are dropped.
+    """
+    roots = set()
+    for pattern in patterns:
+        literal_segments = []
+        for segment in pattern.split("/")[:-1]:
+            if _is_glob(segment):
+                break
+            literal_segments.append(segment)
+        roots.add("/".join(literal_segments))
+    
+    if "" in roots:
+        return [""]
+    return sorted(
+        root for root in roots
+        if not any(root.startswith(other + "/") for other in roots)
+    )
+
+
+# Include patterns are partitioned and compiled once at import time. Literal
+# paths are resolved directly and only the wildcard patterns are matched
+# during the walk, which starts at each wildcard's literal directory prefix
+# instead of scanning the whole project
+_LITERAL_INCLUDES = [p for p in INCLUDE_PATTERNS if not _is_glob(p)]
+_WILDCARD_INCLUDES = [p for p in INCLUDE_PATTERNS if _is_glob(p)]
+_INCLUDE_RE = _compile_include_regex(_WILDCARD_INCLUDES)
+_WALK_ROOTS = _walk_roots(_WILDCARD_INCLUDES)
+_EXCLUDE_RE = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in EXCLUDE_PATTERNS))
+
+
+def get_files_to_package() -> list:
+    """Get list of files to include in the package, as POSIX-style relative paths."""
+    literal_matches = _find_literal_files(_LITERAL_INCLUDES)
+    files = sorted(literal_matches)
+    
+    # Relative paths are sliced off the walked paths as plain strings rather
+    # than going through Path.relative_to for every file
+    base_str = os.fspath(Path(".").resolve())
+    prefix_length = len(base_str) + 1
+    
+    # The walk visits each file once and in a stable order, so its matches are
+    # appended directly; only overlap with the literal files needs checking
+    for root in _WALK_ROOTS:
+        for path in _walk(os.path.join(base_str, root) if root else base_str):
+            relative_path = path[prefix_length:]
+            if os.sep != "/":
+                relative_path = relative_path.replace(os.sep, "/")
+            
+            if relative_path in literal_matches or not _INCLUDE_RE.match(relative_path):
+                continue
+            
+            if _EXCLUDE_RE.match(relative_path):
+                continue
+            
+            files.append(relative_path)
+    
+    return files
+
+
+def create_package_directory(package_name: str) -> Path:
+    """Create a temporary package directory."""
+    package_dir = Path(f"dist/{package_name}")
+    
+    # Remove existing package directory
+    if package_dir.exists():
+        shutil.rmtree(package_dir)
+    
+    # Create new package directory
+    package_dir.mkdir(parents=True, exist_ok=True)
+    
+    return package_dir
+
+
+def _copy_file(source: Path, destination: Path) -> None:
+    """
+    Copy file contents from source to destination.
+    
+    On Linux os.copy_file_range lets the kernel copy (or reflink) the data
+    without a round trip through userspace; anything else falls back to
+    shutil.copyfile, which uses sendfile/fcopyfile where available.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+    
+    shutil.copyfile(source, destination)
+
+
+def copy_files_to_package(files: list, package_dir: Path) -> bool:
+    """Copy files to the package directory."""
+    try:
+        copies = [(Path(file_path), package_dir / file_path) for file_path in files]
+        
+        # Create every directory once up front, shallowest first, so each
+        # makedirs call finds its parent already present and the workers
+        # never race on mkdir
+        dirs_needed = set()
+        for _, destination in copies:
+            parent = destination.parent
+            while parent != package_dir and parent not in dirs_needed:
+                dirs_needed.add(parent)
+                parent = parent.parent
+        for directory in sorted(dirs_needed, key=lambda d: len(d.parts)):
+            os.makedirs(directory, exist_ok=True)
+        
+        # Each copy is dominated by syscall latency, so overlap them in threads
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda pair: _copy_file(*pair), copies))
+            list(executor.map(lambda pair: shutil.copystat(*pair), copies))
+        
+        print_step(f"Copied {len(files)} files to package directory", "SUCCESS")
+        return True
+        
+    except Exception as e:
+        print_step(f"Failed to copy files: {e}", "ERROR")
+        return False
+
+
+def _dumps_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def build_package_manifest(files: list, package_info: dict) -> dict:
+    """Build the package manifest contents."""
+    return {
+        "package_info": package_info,
+        "files": [str(f) for f in files],
+        "file_count": len(files),
+        "installation_instructions": [
+            "1. Extract the package to your desired location",
+            "2. Navigate to the extracted directory",
+            "3. Run: python setup.py",
+            "4. Follow the setup instructions",
+            "5. Start the server: python run_server.py",
+            "6. Run the demo: python demo_client.py"
+        ],
+        "requirements": [
+            "Python 3.8 or higher",
+            "pip package manager",
+            "At least 100MB free disk space",
+            "Internet connection for initial setup"
+        ]
+    }
+
+
+def build_generated_files(files: list, package_info: dict) -> dict:
+    """
+    Render the files generated for the package, keyed by name.
+    
+    The manifest is serialized once here and the same bytes are shared by the
+    ZIP, the tarball and the staging directory.
+    """
+    return {
+        "PACKAGE_MANIFEST.json": _dumps_json(build_package_manifest(files, package_info)),
+        "QUICK_START.md": _QUICK_START_MD
+    }
+
+
+def write_generated_files(package_dir: Path, generated: dict) -> bool:
+    """Write the generated package files (manifest, quick start guide) to the package directory."""
+    try:
+        for name, content in generated.items():
+            (package_dir / name).write_bytes(content)
+        
+        print_step("Created package manifest and quick start guide", "SUCCESS")
         return True
         
     except Exception as e:
-        print_step(f"Failed to create quick start guide: {e}", "ERROR")
+        print_step(f"Failed to create generated files: {e}", "ERROR")
         return False
 
 
-def create_zip_package(package_dir: Path, package_name: str) -> bool:
-    """Create a ZIP file of the package."""
+def create_zip_package(files: list, package_name: str, generated: dict) -> bool:
+    """Create a ZIP file of the package by streaming the source files directly."""
     try:
         zip_path = Path(f"dist/{package_name}.zip")
         
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in package_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(package_dir.parent)
-                    zipf.write(file_path, arcname)
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=ARCHIVE_COMPRESSLEVEL) as zipf:
+            for file_path in files:
+                if os.path.getsize(file_path) < ZIP_STORE_THRESHOLD:
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+                zipf.write(file_path, f"{package_name}/{file_path}",
+                           compress_type=compress_type, compresslevel=ARCHIVE_COMPRESSLEVEL)
+            
+            for name, content in generated.items():
+                zipf.writestr(f"{package_name}/{name}", content)
         
         file_size = zip_path.stat().st_size
         size_mb = file_size / (1024 * 1024)
@@ -346,15 +550,36 @@ def create_zip_package(package_dir: Path, package_name: str) -> bool:
         return False
 
 
-def create_tar_package(package_dir: Path, package_name: str) -> bool:
-    """Create a TAR.GZ file of the package."""
+def _add_tar_member(tarf, arcname: str, content: bytes) -> None:
+    """Add an in-memory file to an open tar archive."""
+    import io
+    import tarfile
+    import time
+    
+    tarinfo = tarfile.TarInfo(arcname)
+    tarinfo.size = len(content)
+    tarinfo.mtime = int(time.time())
+    tarinfo.mode = 0o644
+    tarf.addfile(tarinfo, io.BytesIO(content))
+
+
+def create_tar_package(files: list, package_name: str, generated: dict) -> bool:
+    """Create a TAR.GZ file of the package from the source file list."""
     try:
+        import gzip
         import tarfile
         
         tar_path = Path(f"dist/{package_name}.tar.gz")
         
-        with tarfile.open(tar_path, 'w:gz') as tarf:
-            tarf.add(package_dir, arcname=package_name)
+        # Stream mode ("w|") avoids seeks; compresslevel=1 trades a slightly
+        # larger archive of plain source text for much faster compression
+        with gzip.GzipFile(tar_path, 'wb', compresslevel=ARCHIVE_COMPRESSLEVEL) as gz, \
+                tarfile.open(fileobj=gz, mode='w|') as tarf:
+            for file_path in files:
+                tarf.add(file_path, arcname=f"{package_name}/{file_path}", recursive=False)
+            
+            for name, content in generated.items():
+                _add_tar_member(tarf, f"{package_name}/{name}", content)
         
         file_size = tar_path.stat().st_size
         size_mb = file_size / (1024 * 1024)
@@ -369,67 +594,97 @@ def create_tar_package(package_dir: Path, package_name: str) -> bool:
 
 def main():
     """Main packaging function."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Create distributable packages of the Custom MCP Server")
+    parser.add_argument(
+        "--staging-dir",
+        action="store_true",
+        help="Also write an unpacked copy of the package to dist/<package>/"
+    )
+    args = parser.parse_args()
+    
+    try:
+        _package(stage=args.staging_dir)
+    finally:
+        flush_output()
+
+
+def _package(stage: bool = False):
+    """
+    Run the packaging phases, flushing queued output at each phase boundary.
+    
+    The archives are built straight from the source files; the unpacked
+    dist/<package>/ directory is only written when stage is True.
+    """
     print_banner("Custom MCP Server Packaging")
     
     package_info = create_package_info()
     package_name = f"{package_info['name']}-v{package_info['version']}"
     
-    print(f"Creating package: {package_name}")
-    print(f"Python version: {package_info['python_version']}")
-    print(f"Platform: {package_info['platform']}")
+    emit(f"Creating package: {package_name}")
+    emit(f"Python version: {package_info['python_version']}")
+    emit(f"Platform: {package_info['platform']}")
     
     # Get files to package
     print_step("Scanning files to package...", "PROGRESS")
+    flush_output()
     files = get_files_to_package()
     print_step(f"Found {len(files)} files to package", "SUCCESS")
     
-    # Create package directory
-    print_step("Creating package directory...", "PROGRESS")
-    package_dir = create_package_directory(package_name)
-    
-    # Copy files
-    print_step("Copying files to package...", "PROGRESS")
-    if not copy_files_to_package(files, package_dir):
-        sys.exit(1)
-    
-    # Create manifest
-    print_step("Creating package manifest...", "PROGRESS")
-    if not create_package_manifest(package_dir, files, package_info):
-        sys.exit(1)
+    generated = build_generated_files(files, package_info)
+    Path("dist").mkdir(exist_ok=True)
     
-    # Create quick start guide
-    print_step("Creating quick start guide...", "PROGRESS")
-    if not create_quick_start_guide(package_dir):
-        sys.exit(1)
+    if stage:
+        # Create package directory
+        print_step("Creating package directory...", "PROGRESS")
+        flush_output()
+        package_dir = create_package_directory(package_name)
+        
+        # Copy files
+        print_step("Copying files to package...", "PROGRESS")
+        flush_output()
+        if not copy_files_to_package(files, package_dir):
+            sys.exit(1)
+        
+        # Create manifest and quick start guide
+        print_step("Creating package manifest and quick start guide...", "PROGRESS")
+        flush_output()
+        if not write_generated_files(package_dir, generated):
+            sys.exit(1)
     
     # Create ZIP package
     print_step("Creating ZIP package...", "PROGRESS")
-    if not create_zip_package(package_dir, package_name):
+    flush_output()
+    if not create_zip_package(files, package_name, generated):
         sys.exit(1)
     
     # Create TAR.GZ package (if not on Windows)
     if sys.platform != "win32":
         print_step("Creating TAR.GZ package...", "PROGRESS")
-        if not create_tar_package(package_dir, package_name):
+        flush_output()
+        if not create_tar_package(files, package_name, generated):
             print_step("TAR.GZ creation failed, but ZIP is available", "WARNING")
     
     print_banner("Packaging Complete!")
-    print(f"Package created successfully: {package_name}")
-    print(f"Location: dist/{package_name}.zip")
+    emit(f"Package created successfully: {package_name}")
+    emit(f"Location: dist/{package_name}.zip")
     if sys.platform != "win32":
-        print(f"Also available: dist/{package_name}.tar.gz")
-    
-    print("\nPackage contents:")
-    print(f"- {len(files)} source files")
-    print("- Complete documentation")
-    print("- Setup and startup scripts")
-    print("- Test suite")
-    print("- Quick start guide")
-    
-    print("\nTo distribute:")
-    print("1. Share the ZIP file with users")
-    print("2. Users should extract and run: python setup.py")
-    print("3. Then follow the QUICK_START.md guide")
+        emit(f"Also available: dist/{package_name}.tar.gz")
+    if stage:
+        emit(f"Unpacked copy: dist/{package_name}/")
+    
+    emit("\nPackage contents:")
+    emit(f"- {len(files)} source files")
+    emit("- Complete documentation")
+    emit("- Setup and startup scripts")
+    emit("- Test suite")
+    emit("- Quick start guide")
+    
+    emit("\nTo distribute:")
+    emit("1. Share the ZIP file with users")
+    emit("2. Users should extract and run: python setup.py")
+    emit("3. Then follow the QUICK_START.md guide")
 
 
 if __name__ == "__main__":
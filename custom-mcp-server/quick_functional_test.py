@@ -26,59 +26,49 @@ def print_status(message: str, status: str = "INFO") -> None:
     symbol = status_symbols.get(status, "•")
     print(f"{symbol} {message}")
 
-def test_database_operations():
+def test_database_operations(db):
     """Test basic database operations."""
     print_status("Testing database operations...", "PROGRESS")
     
     try:
-        from database.manager import DatabaseManager
-        
-        # Use a test database
-        test_db_path = "data/test_functional.json"
-        
-        with DatabaseManager(test_db_path) as db:
-            # Test CREATE
-            user_data = {
-                "name": "Test User",
-                "email": "test@example.com",
-                "role": "user"
-            }
-            
-            result = db.create_record("users", user_data)
-            if not result.get("success"):
-                print_status(f"CREATE failed: {result.get('error')}", "ERROR")
-                return False
-            
-            user_id = result["data"]["id"]
-            print_status(f"CREATE: Created user with ID {user_id}", "SUCCESS")
-            
-            # Test READ
-            users = db.read_records("users")
-            if not users or len(users) == 0:
-                print_status("READ failed: No users found", "ERROR")
-                return False
-            
-            print_status(f"READ: Found {len(users)} users", "SUCCESS")
-            
-            # Test UPDATE
-            update_result = db.update_records("users", {"id": user_id}, {"role": "admin"})
-            if update_result == 0:
-                print_status("UPDATE failed: No records updated", "ERROR")
-                return False
-            
-            print_status(f"UPDATE: Updated {update_result} records", "SUCCESS")
-            
-            # Test DELETE
-            delete_result = db.delete_records("users", {"id": user_id})
-            if delete_result == 0:
-                print_status("DELETE failed: No records deleted", "ERROR")
-                return False
-            
-            print_status(f"DELETE: Deleted {delete_result} records", "SUCCESS")
+        # Test CREATE
+        user_data = {
+            "name": "Test User",
+            "email": "test@example.com",
+            "role": "user"
+        }
+        
+        result = db.create_record("users", user_data)
+        if not result.get("success"):
+            print_status(f"CREATE failed: {result.get('error')}", "ERROR")
+            return False
         
-        # Clean up test database
-        if Path(test_db_path).exists():
-            Path(test_db_path).unlink()
+        user_id = result["data"]["id"]
+        print_status(f"CREATE: Created user with ID {user_id}", "SUCCESS")
+        
+        # Test READ
+        users = db.read_records("users")
+        if not users or len(users) == 0:
+            print_status("READ failed: No users found", "ERROR")
+            return False
+        
+        print_status(f"READ: Found {len(users)} users", "SUCCESS")
+        
+        # Test UPDATE
+        update_result = db.update_records("users", {"id": user_id}, {"role": "admin"})
+        if update_result == 0:
+            print_status("UPDATE failed: No records updated", "ERROR")
+            return False
+        
+        print_status(f"UPDATE: Updated {update_result} records", "SUCCESS")
+        
+        # Test DELETE
+        delete_result = db.delete_records("users", {"id": user_id})
+        if delete_result == 0:
+            print_status("DELETE failed: No records deleted", "ERROR")
+            return False
+        
+        print_status(f"DELETE: Deleted {delete_result} records", "SUCCESS")
         
         return True
         
@@ -142,37 +132,22 @@ def test_query_parser():
         print_status(f"Query parser test failed: {e}", "ERROR")
         return False
 
-def test_database_initialization():
+def test_database_initialization(db):
     """Test database initialization with sample data."""
     print_status("Testing database initialization...", "PROGRESS")
     
     try:
-        from database.manager import DatabaseManager
+        # Reset so the check does not depend on what earlier tests left behind
+        db.initialize_sample_data(force_reset=True)
         
-        # Test with a temporary database
-        test_db_path = "data/test_init.json"
-        
-        # Remove if exists
-        if Path(test_db_path).exists():
-            Path(test_db_path).unlink()
-        
-        # Initialize using DatabaseManager
-        with DatabaseManager(test_db_path) as db:
-            # This should create the database and initialize sample data
-            db.initialize_sample_data()
-            
-            # Check if data was populated
-            users = db.read_records("users")
-            tasks = db.read_records("tasks")
-            products = db.read_records("products")
-            
-            if len(users) < 3 or len(tasks) < 5 or len(products) < 4:
-                print_status(f"Insufficient sample data: users={len(users)}, tasks={len(tasks)}, products={len(products)}", "ERROR")
-                return False
+        # Check if data was populated
+        users = db.read_records("users")
+        tasks = db.read_records("tasks")
+        products = db.read_records("products")
         
-        # Clean up
-        if Path(test_db_path).exists():
-            Path(test_db_path).unlink()
+        if len(users) < 3 or len(tasks) < 5 or len(products) < 4:
+            print_status(f"Insufficient sample data: users={len(users)}, tasks={len(tasks)}, products={len(products)}", "ERROR")
+            return False
         
         print_status("Database initialization working correctly", "SUCCESS")
         return True
@@ -187,26 +162,46 @@ def main():
     print(" Custom MCP Server Functional Tests ")
     print("=" * 60)
     
-    tests = [
-        ("Database Operations", test_database_operations),
-        ("Response Formatter", test_response_formatter),
-        ("Query Parser", test_query_parser),
-        ("Database Initialization", test_database_initialization)
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
-        print(f"\n{test_name}:")
-        try:
-            if test_func():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print_status(f"Test error: {e}", "ERROR")
-            failed += 1
+    test_db_path = None
+    
+    try:
+        from database.manager import DatabaseManager, PROJECT_ROOT
+        
+        # Build the path the manager resolves relative paths to, so the
+        # file is cleaned up whatever the working directory
+        test_db_path = PROJECT_ROOT / "data" / "test_functional.json"
+        if test_db_path.exists():
+            test_db_path.unlink()
+        
+        # All database tests share one connection so the JSON file is parsed once
+        with DatabaseManager(str(test_db_path)) as db:
+            tests = [
+                ("Database Operations", lambda: test_database_operations(db)),
+                ("Response Formatter", test_response_formatter),
+                ("Query Parser", test_query_parser),
+                ("Database Initialization", lambda: test_database_initialization(db))
+            ]
+            
+            for test_name, test_func in tests:
+                print(f"\n{test_name}:")
+                try:
+                    if test_func():
+                        passed += 1
+                    else:
+                        failed += 1
+                except Exception as e:
+                    print_status(f"Test error: {e}", "ERROR")
+                    failed += 1
+    except Exception as e:
+        print_status(f"Could not open test database: {e}", "ERROR")
+        failed += 1
+    finally:
+        # Clean up test database
+        if test_db_path is not None and test_db_path.exists():
+            test_db_path.unlink()
     
     print("\n" + "=" * 60)
     print(f" Test Results: {passed} passed, {failed} failed ")
@@ -8,6 +8,7 @@ import sys
 import os
 import asyncio
 import logging
+import time
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -15,6 +16,30 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from mcp_server import MCPServer
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Log formatter that only re-runs strftime when the second changes.
+    
+    Records logged within the same second reuse the formatted timestamp and
+    only append their own milliseconds.
+    """
+    
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_second = None
+        self._cached_time = ""
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
 def setup_environment():
     """
     Set up the environment for running the MCP server.
@@ -24,10 +49,36 @@ def setup_environment():
     os.makedirs(data_dir, exist_ok=True)
     
     # Set up basic logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+        root_logger.addHandler(handler)
+    root_logger.setLevel(logging.INFO)
+    
+    # None of these record attributes are used by the format, so skip
+    # collecting them for every log record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+
+def install_event_loop_policy():
+    """
+    Use uvloop's event loop when it is available.
+    
+    uvloop does not support Windows; everywhere else it is optional and the
+    default asyncio loop is used when it is not installed.
+    """
+    if sys.platform == "win32":
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 async def main():
@@ -55,4 +106,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    install_event_loop_policy()
+    asyncio.run(main(), debug=False)
\ No newline at end of file
@@ -6,29 +6,58 @@ This script helps with installation, configuration, and initial setup.
 
 import os
 import sys
+import shutil
 import subprocess
 import json
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
 
+SETUP_CACHE_PATH = Path(".setup_cache.json")
+
+# Source files whose import is checked by verify_installation
+VERIFY_SOURCE_FILES = (
+    "src/mcp_server.py",
+    "src/mcp_client.py",
+    "src/database/manager.py"
+)
+
+# Files outside src whose changes invalidate a previous import check: the
+# requirements and the virtual environment's configuration
+VERIFY_ENVIRONMENT_FILES = (
+    "requirements.txt",
+    os.path.join("venv", "pyvenv.cfg")
+)
+
+
 def print_banner(title: str, width: int = 60) -> None:
     """Print a formatted banner."""
-    print("\n" + "=" * width)
-    print(f" {title.center(width - 2)} ")
-    print("=" * width + "\n")
+    bar = "=" * width
+    sys.stdout.write(f"\n{bar}\n {title.center(width - 2)} \n{bar}\n\n")
+
+
+# Symbols shown before each step message, keyed by status
+_STATUS_SYMBOLS = {
+    "INFO": "ℹ",
+    "SUCCESS": "✓",
+    "WARNING": "⚠",
+    "ERROR": "✗",
+    "PROGRESS": "→"
+}
+
+# Serializes step output from the steps that run on worker threads
+_print_lock = threading.Lock()
 
 
 def print_step(step: str, status: str = "INFO") -> None:
     """Print a setup step with status."""
-    status_symbols = {
-        "INFO": "ℹ",
-        "SUCCESS": "✓",
-        "WARNING": "⚠",
-        "ERROR": "✗",
-        "PROGRESS": "→"
-    }
-    symbol = status_symbols.get(status, "•")
-    print(f"{symbol} {step}")
+    symbol = _STATUS_SYMBOLS.get(status, "•")
+    with _print_lock:
+        print(f"{symbol} {step}")
 
 
 def check_python_version() -> bool:
@@ -52,7 +81,12 @@ def create_virtual_environment() -> bool:
     
     try:
         print_step("Creating virtual environment...", "PROGRESS")
-        subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
+        uv_cmd = shutil.which("uv")
+        if uv_cmd:
+            # uv creates the environment without running ensurepip
+            subprocess.run([uv_cmd, "venv", "--seed", "--python", sys.executable, "venv"], check=True)
+        else:
+            subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
         print_step("Virtual environment created successfully", "SUCCESS")
         return True
     except subprocess.CalledProcessError as e:
@@ -60,6 +94,14 @@ def create_virtual_environment() -> bool:
         return False
 
 
+def get_python_command() -> str:
+    """Get the virtual environment's Python interpreter for the current platform."""
+    if sys.platform == "win32":
+        return os.path.join("venv", "Scripts", "python")
+    else:
+        return os.path.join("venv", "bin", "python")
+
+
 def get_pip_command() -> str:
     """Get the appropriate pip command for the current platform."""
     if sys.platform == "win32":
@@ -71,14 +113,19 @@ def get_pip_command() -> str:
 def install_dependencies() -> bool:
     """Install required dependencies."""
     pip_cmd = get_pip_command()
+    python_cmd = get_python_command()
+    uv_cmd = shutil.which("uv")
     
-    if not os.path.exists(pip_cmd):
+    if not os.path.exists(python_cmd if uv_cmd else pip_cmd):
         print_step("Virtual environment not found - please create it first", "ERROR")
         return False
     
     try:
         print_step("Installing dependencies...", "PROGRESS")
-        subprocess.run([pip_cmd, "install", "-r", "requirements.txt"], check=True)
+        if uv_cmd:
+            subprocess.run([uv_cmd, "pip", "install", "--python", python_cmd, "-r", "requirements.txt"], check=True)
+        else:
+            subprocess.run([pip_cmd, "install", "-r", "requirements.txt"], check=True)
         print_step("Dependencies installed successfully", "SUCCESS")
         return True
     except subprocess.CalledProcessError as e:
@@ -86,6 +133,218 @@ def install_dependencies() -> bool:
         return False
 
 
+def compile_sources() -> bool:
+    """Pre-compile the source tree so the first server start uses cached bytecode."""
+    import compileall
+    
+    try:
+        print_step("Compiling source files...", "PROGRESS")
+        if not compileall.compile_dir("src", quiet=1, workers=0):
+            print_step("Some source files failed to compile", "ERROR")
+            return False
+        print_step("Source files compiled successfully", "SUCCESS")
+        return True
+    except Exception as e:
+        print_step(f"Failed to compile source files: {e}", "ERROR")
+        return False
+
+
+# Steps run inside the virtual environment's Python by run_bootstrap. Each
+# step appends one JSON line to the report file named by the environment
+# variable below, so step output (including log lines written from other
+# threads) never mixes with the reports; stdout is passed through as is.
+BOOTSTRAP_REPORT_ENV = "SETUP_BOOTSTRAP_REPORT"
+BOOTSTRAP_MODULE = """
+import json
+import os
+import runpy
+import sys
+
+
+def report(step, ok, error=None):
+    line = json.dumps({"step": step, "ok": ok, "error": error}) + "\\n"
+    with open(os.environ["SETUP_BOOTSTRAP_REPORT"], "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+def main():
+    sys.path.insert(0, 'src')
+    
+    for step in sys.argv[1:]:
+        if step == "init_db":
+            try:
+                namespace = runpy.run_path("src/database/init_db.py")
+                exit_code = namespace["main"]()
+                report(step, exit_code == 0, None if exit_code == 0 else f"exit code {exit_code}")
+            except Exception as e:
+                report(step, False, str(e))
+        elif step == "imports":
+            try:
+                from mcp_server import MCPServer
+                from mcp_client import MCPClient
+                from database.manager import DatabaseManager
+                report(step, True)
+            except ImportError as e:
+                report(step, False, f"Import error: {e}")
+"""
+
+# The bootstrap steps are imported as a module from the setup cache directory
+# rather than passed with -c, so the interpreter caches their bytecode
+SETUP_CACHE_DIR = Path(".setup_cache")
+BOOTSTRAP_MODULE_NAME = "setup_bootstrap"
+BOOTSTRAP_COMMAND = (
+    f"import sys; sys.path.insert(0, {str(SETUP_CACHE_DIR)!r}); "
+    f"import {BOOTSTRAP_MODULE_NAME}; {BOOTSTRAP_MODULE_NAME}.main()"
+)
+
+
+def write_bootstrap_module() -> None:
+    """Write the bootstrap module to the setup cache directory if it has changed."""
+    module_path = SETUP_CACHE_DIR / f"{BOOTSTRAP_MODULE_NAME}.py"
+    
+    try:
+        if module_path.read_text(encoding="utf-8") == BOOTSTRAP_MODULE:
+            # Leave the file untouched so its cached bytecode stays valid
+            return
+    except OSError:
+        pass
+    
+    SETUP_CACHE_DIR.mkdir(exist_ok=True)
+    module_path.write_text(BOOTSTRAP_MODULE, encoding="utf-8")
+
+
+def _verify_cache_key() -> str:
+    """
+    Hash the path, mtime and size of every file the import check depends on.
+    
+    That is every Python source under src, the environment files and the
+    virtual environment's interpreter, so editing any module, changing the
+    requirements or recreating the virtual environment forces a new check.
+    
+    Returns:
+        Hex digest, or an empty string if a verified source file is missing
+    """
+    if find_missing_file(VERIFY_SOURCE_FILES) is not None:
+        return ""
+    
+    digest = hashlib.blake2b(digest_size=16)
+    
+    dependency_files = [
+        *sorted(str(path) for path in Path("src").rglob("*.py")),
+        *VERIFY_ENVIRONMENT_FILES,
+        get_python_command()
+    ]
+    for file_path in dependency_files:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Record missing files too, so creating one changes the key
+            digest.update(f"{file_path}\0missing\n".encode("utf-8"))
+            continue
+        digest.update(f"{file_path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8"))
+    
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_setup_cache(mtime_ns: int, size: int) -> dict:
+    """Parse the setup cache file; the arguments only key the memoized result."""
+    try:
+        with open(SETUP_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _load_setup_cache() -> dict:
+    """
+    Load the setup cache, returning an empty dict if it is missing or unreadable.
+    
+    The file is only parsed again when its mtime or size changes. The
+    returned dict is shared between calls and must not be modified.
+    """
+    try:
+        stat = os.stat(SETUP_CACHE_PATH)
+    except OSError:
+        return {}
+    
+    return _read_setup_cache(stat.st_mtime_ns, stat.st_size)
+
+
+def _imports_verified() -> bool:
+    """Check whether the current source files already passed the import check."""
+    key = _verify_cache_key()
+    return bool(key) and _load_setup_cache().get("verify_key") == key
+
+
+def _record_imports_verified() -> None:
+    """Remember that the current source files passed the import check."""
+    key = _verify_cache_key()
+    if not key:
+        return
+    
+    cache = dict(_load_setup_cache())
+    cache["verify_key"] = key
+    cache["verified_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    
+    try:
+        with open(SETUP_CACHE_PATH, 'w') as f:
+            f.write(json.dumps(cache, indent=2))
+    except OSError:
+        pass
+
+
+# Results of bootstrap steps that have already run, keyed by step name
+_bootstrap_results = {}
+
+
+def run_bootstrap(steps: list) -> dict:
+    """
+    Run the given bootstrap steps in a single virtual environment Python process.
+    
+    Returns a dict mapping each reported step name to its
+    {"step", "ok", "error"} result.
+    """
+    results = {}
+    report_path = SETUP_CACHE_DIR / "bootstrap_report.jsonl"
+    
+    try:
+        write_bootstrap_module()
+        report_path.unlink(missing_ok=True)
+        completed = subprocess.run(
+            [get_python_command(), "-c", BOOTSTRAP_COMMAND, *steps],
+            capture_output=True, text=True,
+            env={**os.environ, BOOTSTRAP_REPORT_ENV: str(report_path.resolve())}
+        )
+        report_lines = report_path.read_text(encoding="utf-8").splitlines() if report_path.exists() else []
+    except Exception as e:
+        return {step: {"step": step, "ok": False, "error": str(e)} for step in steps}
+    finally:
+        try:
+            report_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    
+    for line in report_lines:
+        try:
+            result = json.loads(line)
+        except ValueError:
+            # A report cut short by a crash; the step counts as not reported
+            continue
+        results[result["step"]] = result
+    
+    if completed.stdout.strip():
+        print(completed.stdout.rstrip("\n"))
+    
+    for step in steps:
+        if step not in results:
+            error = completed.stderr.strip() or f"exit code {completed.returncode}"
+            results[step] = {"step": step, "ok": False, "error": error}
+    
+    _bootstrap_results.update(results)
+    return results
+
+
 def setup_directories() -> bool:
     """Create necessary directories."""
     directories = ["data", "logs"]
@@ -107,21 +366,21 @@ def setup_directories() -> bool:
 
 def initialize_database() -> bool:
     """Initialize the database with sample data."""
-    try:
-        print_step("Initializing database...", "PROGRESS")
-        
-        # Use the virtual environment's Python
-        if sys.platform == "win32":
-            python_cmd = os.path.join("venv", "Scripts", "python")
-        else:
-            python_cmd = os.path.join("venv", "bin", "python")
-        
-        subprocess.run([python_cmd, "src/database/init_db.py"], check=True)
+    print_step("Initializing database...", "PROGRESS")
+    
+    # Run the import check in the same interpreter so verification doesn't
+    # need a second startup of the virtual environment's Python.
+    steps = ["init_db"] if _imports_verified() else ["init_db", "imports"]
+    results = run_bootstrap(steps)
+    result = results.get("init_db")
+    
+    if result and result["ok"]:
         print_step("Database initialized successfully", "SUCCESS")
         return True
-    except subprocess.CalledProcessError as e:
-        print_step(f"Failed to initialize database: {e}", "ERROR")
-        return False
+    
+    error = result.get("error") if result else "no result reported"
+    print_step(f"Failed to initialize database: {error}", "ERROR")
+    return False
 
 
 def create_config_file() -> bool:
@@ -149,7 +408,7 @@ def create_config_file() -> bool:
     
     try:
         with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+            f.write(json.dumps(config, indent=2))
         print_step("Configuration file created", "SUCCESS")
         return True
     except Exception as e:
@@ -210,60 +469,72 @@ venv/bin/python demo_client.py
     return True
 
 
+def find_missing_file(file_paths: list):
+    """
+    Return the first of the given files that does not exist, or None.
+    
+    Each parent directory is listed once instead of stat-ing every file.
+    """
+    listings = {}
+    
+    for file_path in file_paths:
+        parent, name = os.path.split(file_path)
+        parent = parent or "."
+        
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = None
+        
+        present = listings[parent]
+        if present is None:
+            # Parent can't be listed; check the file itself
+            if not Path(file_path).exists():
+                return file_path
+        elif name not in present:
+            return file_path
+    
+    return None
+
+
 def verify_installation() -> bool:
     """Verify that the installation is working correctly."""
     print_step("Verifying installation...", "PROGRESS")
     
     # Check if key files exist
     key_files = [
-        "src/mcp_server.py",
-        "src/mcp_client.py",
-        "src/database/manager.py",
+        *VERIFY_SOURCE_FILES,
         "data/mcp_server.json",
         "requirements.txt"
     ]
     
-    for file_path in key_files:
-        if not Path(file_path).exists():
-            print_step(f"Missing required file: {file_path}", "ERROR")
-            return False
+    missing_file = find_missing_file(key_files)
+    if missing_file is not None:
+        print_step(f"Missing required file: {missing_file}", "ERROR")
+        return False
     
     print_step("All required files present", "SUCCESS")
     
-    # Test import of main modules
-    try:
-        if sys.platform == "win32":
-            python_cmd = os.path.join("venv", "Scripts", "python")
-        else:
-            python_cmd = os.path.join("venv", "bin", "python")
-        
-        test_script = """
-import sys
-import os
-sys.path.insert(0, 'src')
-try:
-    from mcp_server import MCPServer
-    from mcp_client import MCPClient
-    from database.manager import DatabaseManager
-    print("✓ All modules imported successfully")
-except ImportError as e:
-    print(f"✗ Import error: {e}")
-    sys.exit(1)
-"""
-        
-        result = subprocess.run([python_cmd, "-c", test_script], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print_step("Module imports successful", "SUCCESS")
-            return True
-        else:
-            print_step(f"Module import failed: {result.stderr}", "ERROR")
-            return False
-            
-    except Exception as e:
-        print_step(f"Verification failed: {e}", "ERROR")
-        return False
+    # Skip the import check if these sources already passed it
+    if _imports_verified():
+        print_step("Module imports previously verified", "SUCCESS")
+        return True
+    
+    # Test import of main modules, reusing the result from database initialization
+    result = _bootstrap_results.get("imports")
+    if result is None:
+        result = run_bootstrap(["imports"]).get("imports")
+    
+    if result and result["ok"]:
+        _record_imports_verified()
+        print_step("Module imports successful", "SUCCESS")
+        return True
+    
+    error = result.get("error") if result else "no result reported"
+    print_step(f"Module import failed: {error}", "ERROR")
+    return False
 
 
 def print_next_steps():
@@ -311,23 +582,47 @@ def main():
     if not check_python_version():
         sys.exit(1)
     
-    # Setup steps
-    steps = [
+    # Setup steps that depend on the virtual environment, run in order
+    environment_steps = [
         ("Creating virtual environment", create_virtual_environment),
         ("Installing dependencies", install_dependencies),
+        ("Compiling sources", compile_sources)
+    ]
+    
+    # Independent filesystem steps, run on worker threads alongside the above
+    parallel_steps = [
         ("Setting up directories", setup_directories),
         ("Creating configuration file", create_config_file),
+        ("Creating startup scripts", create_startup_scripts)
+    ]
+    
+    # Steps that need both groups to have finished
+    final_steps = [
         ("Initializing database", initialize_database),
-        ("Creating startup scripts", create_startup_scripts),
         ("Verifying installation", verify_installation)
     ]
     
-    for step_name, step_func in steps:
-        print(f"\n{step_name}...")
-        if not step_func():
+    def run_steps(steps):
+        for step_name, step_func in steps:
+            with _print_lock:
+                print(f"\n{step_name}...")
+            if not step_func():
+                print_step(f"Setup failed at step: {step_name}", "ERROR")
+                sys.exit(1)
+    
+    print("\nIn the background: " + ", ".join(step_name.lower() for step_name, _ in parallel_steps) + "...")
+    with ThreadPoolExecutor(max_workers=len(parallel_steps)) as executor:
+        parallel_results = executor.map(lambda step: step[1](), parallel_steps)
+        run_steps(environment_steps)
+        parallel_results = list(parallel_results)
+    
+    for (step_name, _), succeeded in zip(parallel_steps, parallel_results):
+        if not succeeded:
             print_step(f"Setup failed at step: {step_name}", "ERROR")
             sys.exit(1)
     
+    run_steps(final_steps)
+    
     print_next_steps()
 
 
@@ -12,22 +12,65 @@ import logging
 # Add the parent src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from client.demo_client import MCPDemonstrationClient
 
-
-async def main():
-    """Main entry point for the demonstration script."""
+def parse_args():
+    """Parse the command-line options."""
     import argparse
     
     parser = argparse.ArgumentParser(description="MCP Server CRUD Operations Demonstration")
     parser.add_argument("--quick", action="store_true", help="Run quick test without user interaction")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def _kernel_supports_io_uring() -> bool:
+    """Check whether the running Linux kernel is new enough (5.11+) for uringcore."""
+    import platform
+    
+    try:
+        major, minor = platform.release().split(".")[:2]
+        return (int(major), int(minor.split("-")[0])) >= (5, 11)
+    except ValueError:
+        return False
+
+
+def install_event_loop_policy():
+    """
+    Use a faster event loop for the stdio round-trips to the server when one is installed.
+    
+    uvloop is preferred on Linux and macOS; uringcore is tried next on Linux
+    kernels that support io_uring. Otherwise the default asyncio loop is kept.
+    """
+    if sys.platform == "win32":
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return
+    
+    if sys.platform.startswith("linux") and _kernel_supports_io_uring():
+        try:
+            import uringcore
+        except ImportError:
+            return
+        asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+
+
+async def main():
+    """Main entry point for the demonstration script."""
+    args = parse_args()
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    # Imported after parsing so --help doesn't load the client and its dependencies
+    from client.demo_client import MCPDemonstrationClient
+    
     demo_client = MCPDemonstrationClient()
     
     try:
@@ -47,4 +90,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    install_event_loop_policy()
+    asyncio.run(main())
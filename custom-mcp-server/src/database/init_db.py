@@ -5,42 +5,72 @@ This script populates the database with sample data for testing and demonstratio
 """
 
 import sys
-import os
+import atexit
+import queue
 import logging
+import logging.handlers
 from pathlib import Path
+from typing import Optional
 
-# Add the src directory to the Python path
-src_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(src_dir))
 
-from database.manager import DatabaseManager
+# Background listener writing queued log records to stdout
+_log_listener: Optional[logging.handlers.QueueListener] = None
 
 
-def setup_logging():
-    """Configure logging for the initialization script."""
+def setup_logging() -> None:
+    """
+    Configure logging for the initialization script.
+    
+    Log calls only enqueue the formatted record; a background listener
+    writes it to stdout and is flushed when the process exits.
+    """
+    global _log_listener
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.StreamHandler(sys.stdout)
+            queue_handler
         ]
     )
+    
+    # basicConfig does nothing if logging was already configured
+    if _log_listener is not None or queue_handler not in logging.getLogger().handlers:
+        return
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 
-def main():
+def main() -> int:
     """Main function to initialize the database with sample data."""
+    if "--help" in sys.argv[1:]:
+        print(__doc__.strip())
+        return 0
+    
     setup_logging()
     logger = logging.getLogger(__name__)
     
     try:
-        # Change to the project root directory
-        project_root = Path(__file__).parent.parent.parent
-        os.chdir(project_root)
+        # Add the src directory to the Python path and import the database
+        # layer only once there is work to do
+        src_dir = str(Path(__file__).parent.parent)
+        if src_dir not in sys.path:
+            sys.path.insert(0, src_dir)
+        
+        from database.manager import DatabaseManager
+        
+        # Resolve the database path against the project root rather than
+        # changing the process-wide working directory
+        project_root = Path(__file__).resolve().parent.parent.parent
         
         logger.info("Starting database initialization...")
         
         # Initialize database manager
-        db_manager = DatabaseManager()
+        db_manager = DatabaseManager(root=project_root)
         
         # Check if database is connected
         if not db_manager.is_connected():
@@ -54,20 +84,25 @@ def main():
         total_records = sum(result.values())
         if total_records > 0:
             logger.info("Database initialization completed successfully!")
-            logger.info(f"Records inserted:")
-            for collection, count in result.items():
-                if count > 0:
-                    logger.info(f"  - {collection}: {count} records")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Records inserted:")
+                for collection, count in result.items():
+                    if count > 0:
+                        logger.info("  - %s: %d records", collection, count)
         else:
             logger.info("Database already contains data. No new records inserted.")
         
+        skipped = sum(1 for count in result.values() if count == 0)
+        if skipped:
+            logger.info("Skipped %d collections already populated", skipped)
+        
         # Close database connection
         db_manager.close()
         
         return 0
         
     except Exception as e:
-        logger.error(f"Database initialization failed: {str(e)}")
+        logger.error("Database initialization failed: %s", e)
         return 1
 
 
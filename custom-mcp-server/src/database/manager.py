@@ -1,15 +1,430 @@
 """
 Database Manager for TinyDB operations.
 Provides CRUD operations and connection handling for the MCP server.
+
+Sample data is seeded with writes deferred: the inserts only update an
+in-memory copy, which is written to the file and fsynced once seeding
+finishes. A crash mid-seed therefore loses the whole seed, which is
+acceptable because the sample data is rebuilt from sample_data.json on the
+next start.
+
+Regular CRUD writes are written and synced one by one by default. Setting
+MCP_WRITE_CACHE_SIZE to N > 1 keeps up to N writes in memory and writes the
+file once per N writes, on DatabaseManager.flush() and on close. The
+trade-off is that a crash loses the buffered writes, and a write that
+cannot be serialized only fails when the buffer is flushed.
 """
 
+import io
 import os
+import re
+import json
+import time
+import functools
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timezone
+import threading
+from collections import Counter
+from functools import reduce
+from operator import and_
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+from pathlib import Path
 from tinydb import TinyDB, Query
+from tinydb.storages import JSONStorage
 from tinydb.table import Table
-from .query_parser import QueryParser
+from .query_parser import QueryParser, membership_condition
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Directory that relative database paths are resolved against
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# A Windows drive letter followed by a separator, as in "Z:\\data\\db.json".
+# "x:data.json" without a separator is a valid file name elsewhere.
+_WINDOWS_DRIVE_RE = re.compile(r"[A-Za-z]:[\\/]")
+
+# Sample users, tasks and products used to seed an empty database
+SAMPLE_DATA_PATH = Path(__file__).with_name("sample_data.json")
+
+# Number of sample documents written per insert while seeding. Every TinyDB
+# insert rebuilds the whole table, so fewer, larger batches are faster.
+DEFAULT_INIT_BATCH_SIZE = 50
+
+
+# Number of CRUD writes kept in memory before the database file is written.
+# 1 writes every change through to disk immediately.
+DEFAULT_WRITE_CACHE_SIZE = 1
+
+
+def get_init_batch_size() -> int:
+    """
+    Get the sample-data batch size, overridable with MCP_INIT_BATCH_SIZE.
+    
+    Returns:
+        Positive batch size, falling back to DEFAULT_INIT_BATCH_SIZE when the
+        environment variable is unset or invalid
+    """
+    try:
+        batch_size = int(os.environ.get("MCP_INIT_BATCH_SIZE", DEFAULT_INIT_BATCH_SIZE))
+    except ValueError:
+        return DEFAULT_INIT_BATCH_SIZE
+    return batch_size if batch_size > 0 else DEFAULT_INIT_BATCH_SIZE
+
+
+def get_write_cache_size() -> int:
+    """
+    Get the number of buffered writes, overridable with MCP_WRITE_CACHE_SIZE.
+    
+    Returns:
+        Positive write cache size, falling back to DEFAULT_WRITE_CACHE_SIZE
+        when the environment variable is unset or invalid
+    """
+    try:
+        cache_size = int(os.environ.get("MCP_WRITE_CACHE_SIZE", DEFAULT_WRITE_CACHE_SIZE))
+    except ValueError:
+        return DEFAULT_WRITE_CACHE_SIZE
+    return cache_size if cache_size > 0 else DEFAULT_WRITE_CACHE_SIZE
+
+
+# Second and formatted date/time of the last _utc_now_iso call
+_utc_second_cache = (None, "")
+
+
+def _utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 timestamp ending in Z.
+    
+    The date and time are only formatted once per second; the microseconds
+    are appended to that cached prefix.
+    """
+    global _utc_second_cache
+    
+    second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _utc_second_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _utc_second_cache = (second, prefix)
+    return f"{prefix}.{nanoseconds // 1000:06d}Z"
+
+
+def load_sample_data() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load the sample documents for every collection from SAMPLE_DATA_PATH.
+    
+    The file is only read once; every call returns fresh copies of the
+    documents, so callers are free to modify them.
+    
+    Returns:
+        Dictionary mapping collection names to lists of sample documents
+    """
+    return {
+        collection_name: _copy_documents(documents)
+        for collection_name, documents in _read_sample_data().items()
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _read_sample_data() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read and parse SAMPLE_DATA_PATH, with orjson when it is installed.
+    
+    The result is cached and shared, so it must not be modified; use
+    load_sample_data() or _copy_documents() to get documents to work with.
+    """
+    raw = SAMPLE_DATA_PATH.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _copy_documents(documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy sample documents, whose fields are all scalar values."""
+    return [dict(document) for document in documents]
+
+
+class DeferrableJSONStorage(JSONStorage):
+    """
+    JSONStorage whose writes can be deferred and committed in one go.
+    
+    The file is parsed and serialized with orjson when it is installed and
+    no json.dumps options were given; the output is plain JSON either way.
+    
+    The last data read or written is kept and returned again while the
+    file's inode, size and modification and change times are unchanged, so
+    repeated reads skip parsing the file. Changes made to the file by other
+    processes are picked up when they alter any of those; a same-size
+    rewrite within one filesystem timestamp tick can go unnoticed.
+    
+    Reads, writes and syncs hold a lock, because the storage is shared by
+    every manager using the same file and a read must not see the file
+    between a write and the truncation that follows it.
+    
+    Writes only replace an in-memory copy of the database, which reads are
+    served from, while deferred is set or until write_cache_size writes have
+    accumulated; sync() then writes that copy to the file once and fsyncs
+    it. Pending writes are also synced when the storage is closed.
+    """
+    
+    def __init__(self, path: str, write_cache_size: int = 1, **kwargs):
+        super().__init__(path, **kwargs)
+        self.deferred = False
+        self.write_cache_size = write_cache_size
+        self._pending: Optional[Dict[str, Dict[str, Any]]] = None
+        self._pending_writes = 0
+        self._use_orjson = orjson is not None and not self.kwargs
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cache_stat: Optional[tuple] = None
+        self._lock = threading.RLock()
+    
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            if self._pending is not None:
+                return self._pending
+            
+            stat = self._file_stat()
+            if self._cache is not None and stat == self._cache_stat:
+                return self._cache
+            
+            if self._use_orjson:
+                self._handle.seek(0)
+                raw = self._handle.read()
+                data = orjson.loads(raw) if raw else None
+            else:
+                data = super().read()
+            
+            self._cache, self._cache_stat = data, stat
+            return data
+    
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._pending = data
+            if self.deferred:
+                return
+            
+            self._pending_writes += 1
+            if self._pending_writes >= self.write_cache_size:
+                self.sync()
+    
+    def sync(self) -> None:
+        """Write out any deferred data and fsync the file."""
+        with self._lock:
+            # Drop the pending data even if writing it fails, so a change
+            # that cannot be serialized does not block every later write
+            pending, self._pending = self._pending, None
+            self._pending_writes = 0
+            if pending is not None:
+                self._write_file(pending)
+                return
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+    
+    def close(self) -> None:
+        with self._lock:
+            try:
+                if self._pending is not None:
+                    self.sync()
+            finally:
+                super().close()
+    
+    def _write_file(self, data: Dict[str, Dict[str, Any]]) -> None:
+        """Serialize the database over the file contents and fsync it."""
+        with self._lock:
+            # TinyDB applies changes to the dictionary it read, which may be
+            # the cached one; it only matches the file again once the write
+            # succeeds
+            self._cache = None
+            
+            if self._use_orjson:
+                serialized = orjson.dumps(data).decode()
+            else:
+                serialized = json.dumps(data, **self.kwargs)
+            
+            self._handle.seek(0)
+            try:
+                self._handle.write(serialized)
+            except io.UnsupportedOperation:
+                raise IOError(f'Cannot write to the database. Access mode is "{self._mode}"')
+            
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            
+            # Drop leftover data if the file has gotten shorter
+            self._handle.truncate()
+            
+            self._cache, self._cache_stat = data, self._file_stat()
+    
+    def _file_stat(self) -> tuple:
+        """Return the inode, size, modification and change times of the database file."""
+        stat = os.fstat(self._handle.fileno())
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
+
+
+# Basic email shape: one @ and a dot in the domain, without whitespace
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Maximum number of distinct filters whose built queries are kept
+QUERY_CACHE_SIZE = 256
+
+# Seconds a user existence check is reused, and how many users are kept;
+# writes through the manager invalidate sooner, other writers within the TTL
+USER_EXISTS_TTL = 5.0
+USER_EXISTS_CACHE_SIZE = 1024
+
+
+def _freeze_filters(value: Any) -> Any:
+    """
+    Convert filter criteria into a hashable cache key.
+    
+    Dictionaries become sorted tuples of their items and lists become
+    tuples, each tagged with its type so the two cannot collide.
+    
+    Raises:
+        TypeError: If the filters contain an unhashable value
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _freeze_filters(item)) for key, item in value.items())))
+    if isinstance(value, list):
+        return (list, tuple(_freeze_filters(item) for item in value))
+    hash(value)
+    return value
+
+
+# Allowed task statuses and priorities, in the order error messages list them
+_TASK_STATUSES = ('pending', 'in_progress', 'completed', 'cancelled', 'archived')
+_TASK_PRIORITIES = ('low', 'medium', 'high', 'urgent')
+_VALID_TASK_STATUSES = frozenset(_TASK_STATUSES)
+_VALID_TASK_PRIORITIES = frozenset(_TASK_PRIORITIES)
+_STATUS_CHOICES_MSG = f"Must be one of: {list(_TASK_STATUSES)}"
+_PRIORITY_CHOICES_MSG = f"Must be one of: {list(_TASK_PRIORITIES)}"
+
+
+def _is_one_of(value: Any, allowed: frozenset) -> bool:
+    """Check set membership, treating unhashable values as not allowed."""
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+def _in_condition(field_query: Any, value: Any) -> Any:
+    """Build an 'in' filter condition matching any of a list of values."""
+    if not isinstance(value, list):
+        return field_query == value
+    
+    return membership_condition(field_query, value)
+
+
+def _exists_condition(field_query: Any, value: Any) -> Any:
+    """Build an 'exists' filter condition, negated for a false value."""
+    if value:
+        return field_query.exists()
+    return ~field_query.exists()
+
+
+# Legacy filter operators, each building a condition from the field's query
+# and the filter value
+_FILTER_OPERATORS = {
+    'eq': lambda field_query, value: field_query == value,
+    'ne': lambda field_query, value: field_query != value,
+    'gt': lambda field_query, value: field_query > value,
+    'gte': lambda field_query, value: field_query >= value,
+    'lt': lambda field_query, value: field_query < value,
+    'lte': lambda field_query, value: field_query <= value,
+    'contains': lambda field_query, value: field_query.search(value),
+    'in': _in_condition,
+    'exists': _exists_condition,
+}
+_FILTER_OPERATORS.update({
+    'equals': _FILTER_OPERATORS['eq'],
+    'not_equals': _FILTER_OPERATORS['ne'],
+    'greater_than': _FILTER_OPERATORS['gt'],
+    'greater_than_or_equal': _FILTER_OPERATORS['gte'],
+    'less_than': _FILTER_OPERATORS['lt'],
+    'less_than_or_equal': _FILTER_OPERATORS['lte'],
+})
+
+
+class _SharedDatabase:
+    """A TinyDB instance shared by every DatabaseManager using the same file."""
+    
+    def __init__(self, key: str, database: TinyDB):
+        self.key = key
+        self.db = database
+        # Number of managers holding the instance; guarded by
+        # _shared_databases_lock
+        self.holders = 0
+        
+        # Source of new IDs per collection, shared so that every manager on
+        # the file draws from one sequence without a table scan. next() on an
+        # itertools.count is atomic, so handing out IDs needs no lock; the
+        # lock guards loading and replacing the counters.
+        self.id_generators: Dict[str, Iterator[int]] = {}
+        self.id_lock = threading.Lock()
+
+
+# Open shared databases, keyed by absolute path. An entry replaced after its
+# file was removed stays open until its last holder releases it.
+_shared_databases: Dict[str, _SharedDatabase] = {}
+_shared_databases_lock = threading.Lock()
+
+# Serializes sample-data seeding. Every TinyDB write rewrites the whole file,
+# so concurrent seeding of separate collections would lose each other's
+# writes, and concurrent managers could both see a collection as empty.
+_seed_lock = threading.Lock()
+
+
+def _acquire_database(db_path: str) -> _SharedDatabase:
+    """
+    Get the shared TinyDB instance for a database file, opening it if needed.
+    
+    Args:
+        db_path: Path to the TinyDB JSON file
+        
+    Returns:
+        Shared database entry, to be passed to _release_database when done
+    """
+    key = os.path.abspath(db_path)
+    
+    with _shared_databases_lock:
+        entry = _shared_databases.get(key)
+        
+        # Reopen if the file was removed since it was opened; the old entry
+        # stays open for the managers still holding it
+        if entry is None or not os.path.exists(key):
+            database = TinyDB(
+                key,
+                storage=DeferrableJSONStorage,
+                encoding='utf-8',
+                write_cache_size=get_write_cache_size()
+            )
+            entry = _SharedDatabase(key, database)
+            _shared_databases[key] = entry
+        
+        entry.holders += 1
+        return entry
+
+
+def _release_database(entry: _SharedDatabase) -> None:
+    """
+    Release a manager's hold on a shared database, closing it when unused.
+    
+    Args:
+        entry: Shared database entry returned by _acquire_database
+    """
+    with _shared_databases_lock:
+        entry.holders -= 1
+        if entry.holders > 0:
+            return
+        
+        # The entry may already have been replaced by a reopened file
+        if _shared_databases.get(entry.key) is entry:
+            del _shared_databases[entry.key]
+    
+    entry.db.close()
 
 
 class DatabaseManager:
@@ -17,25 +432,69 @@ class DatabaseManager:
     Database manager class that handles TinyDB operations.
     Provides methods for accessing users, tasks, and products collections
     with proper error handling.
+    
+    Once __init__ returns, the database and tables are set until close() is
+    called; __init__ raises ConnectionError instead of leaving them unset.
+    Operations therefore do not re-check the connection, and a closed
+    manager is only detected when a collection lookup fails.
     """
     
-    def __init__(self, db_path: str = "data/mcp_server.json"):
+    # Names of the collections, which are also the table attribute names
+    COLLECTION_NAMES = ('users', 'tasks', 'products')
+    
+    # Names of the collection-specific validation methods
+    _CREATE_VALIDATORS = {
+        'users': '_validate_user_data',
+        'tasks': '_validate_task_data',
+        'products': '_validate_product_data'
+    }
+    _UPDATE_VALIDATORS = {
+        'users': '_validate_user_update_data',
+        'tasks': '_validate_task_update_data',
+        'products': '_validate_product_update_data'
+    }
+    
+    def __init__(self, db_path: str = "data/mcp_server.json", root: Optional[Path] = None):
         """
         Initialize the DatabaseManager with TinyDB connection.
         
         Args:
-            db_path: Path to the TinyDB JSON file
+            db_path: Path to the TinyDB JSON file, relative paths being
+                resolved against root rather than the working directory
+            root: Project root directory (defaults to PROJECT_ROOT)
+            
+        Raises:
+            ConnectionError: If db_path starts with a Windows drive on another platform
         """
-        self.db_path = db_path
+        # Elsewhere a path such as "Z:\\data\\db.json" is a plain file name
+        # and would silently create a database under the project root
+        if os.name != 'nt' and _WINDOWS_DRIVE_RE.match(os.fspath(db_path)):
+            raise ConnectionError(f"Database connection failed: {db_path} is not a valid path on this platform")
+        
+        self.root = Path(root) if root is not None else PROJECT_ROOT
+        self.db_path = str(self.root / db_path)
         self.db: Optional[TinyDB] = None
+        self._shared: Optional[_SharedDatabase] = None
         self.users: Optional[Table] = None
         self.tasks: Optional[Table] = None
         self.products: Optional[Table] = None
+        self._collections: Dict[str, Table] = {}
+        self._connected = False
         self.logger = logging.getLogger(__name__)
         self.query_parser = QueryParser()
         
+        # (query, built by legacy parser) pairs from _build_query, keyed by
+        # the frozen filters
+        self._query_cache: Dict[Any, Any] = {}
+        
+        # Results of _validate_user_exists as (monotonic time, exists)
+        self._user_exists_cache: Dict[Any, tuple] = {}
+        
+        # Stateless query root reused by the legacy query builder and lookups
+        self._query = Query()
+        
         # Ensure the data directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         # Initialize database connection
         self._connect()
@@ -46,13 +505,20 @@ class DatabaseManager:
         Handles connection errors gracefully.
         """
         try:
-            self.db = TinyDB(self.db_path)
+            self._shared = _acquire_database(self.db_path)
+            self.db = self._shared.db
             self.users = self.db.table('users')
             self.tasks = self.db.table('tasks')
             self.products = self.db.table('products')
-            self.logger.info(f"Successfully connected to database at {self.db_path}")
+            self._collections = {
+                'users': self.users,
+                'tasks': self.tasks,
+                'products': self.products
+            }
+            self._connected = True
+            self.logger.info("Successfully connected to database at %s", self.db_path)
         except Exception as e:
-            self.logger.error(f"Failed to connect to database: {str(e)}")
+            self.logger.error("Failed to connect to database: %s", e)
             raise ConnectionError(f"Database connection failed: {str(e)}")
     
     def get_collection(self, collection_name: str) -> Table:
@@ -67,22 +533,17 @@ class DatabaseManager:
             
         Raises:
             ValueError: If collection name is invalid
+            ConnectionError: If the manager has been closed
         """
-        collections = {
-            'users': self.users,
-            'tasks': self.tasks,
-            'products': self.products
-        }
+        collection = self._collections.get(collection_name)
+        if collection is not None:
+            return collection
         
-        if collection_name not in collections:
+        if collection_name not in self.COLLECTION_NAMES:
             raise ValueError(f"Invalid collection name: {collection_name}. "
-                           f"Valid options: {list(collections.keys())}")
+                           f"Valid options: {list(self.COLLECTION_NAMES)}")
         
-        collection = collections[collection_name]
-        if collection is None:
-            raise ConnectionError("Database not properly initialized")
-            
-        return collection
+        raise ConnectionError("Database not properly initialized")
     
     def is_connected(self) -> bool:
         """
@@ -91,11 +552,7 @@ class DatabaseManager:
         Returns:
             True if connected, False otherwise
         """
-        return self.db is not None and all([
-            self.users is not None,
-            self.tasks is not None,
-            self.products is not None
-        ])
+        return self._connected
     
     def close(self) -> None:
         """
@@ -103,23 +560,43 @@ class DatabaseManager:
         """
         if self.db is not None:
             try:
-                # TinyDB doesn't have a close method, but we can clear references
+                # The TinyDB instance is shared per file; it is closed once
+                # the last manager using it releases it
+                shared, self._shared = self._shared, None
                 self.db = None
+                _release_database(shared)
                 self.users = None
                 self.tasks = None
                 self.products = None
+                self._collections = {}
+                self._connected = False
                 self.logger.info("Database connection closed")
             except Exception as e:
-                self.logger.warning(f"Error closing database: {str(e)}")
+                self.logger.warning("Error closing database: %s", e)
                 self.db = None
+                self._shared = None
                 self.users = None
                 self.tasks = None
                 self.products = None
+                self._collections = {}
+                self._connected = False
+    
+    def flush(self) -> None:
+        """
+        Write any buffered changes to the database file.
+        
+        Only needed when MCP_WRITE_CACHE_SIZE is above 1; closing the last
+        manager using a file also flushes it.
+        """
+        if self.db is not None:
+            self.db.storage.sync()
     
     def get_next_id(self, collection_name: str) -> int:
         """
         Generate the next available ID for a collection.
         
+        IDs are unique and increasing, but may skip values.
+        
         Args:
             collection_name: Name of the collection
             
@@ -127,23 +604,81 @@ class DatabaseManager:
             Next available integer ID
         """
         try:
-            collection = self.get_collection(collection_name)
-            records = collection.all()
-            if not records:
-                return 1
-            
-            # Find the maximum ID and add 1
-            max_id = max(record.get('id', 0) for record in records)
-            return max_id + 1
+            self.get_collection(collection_name)
+            return next(self._id_generator(collection_name))
         except Exception as e:
-            self.logger.error(f"Error generating next ID for {collection_name}: {str(e)}")
+            self.logger.error("Error generating next ID for %s: %s", collection_name, e)
             raise
     
-    def __enter__(self):
+    def _reserve_ids(self, collection_name: str, count: int) -> List[int]:
+        """
+        Reserve several IDs for a collection at once.
+        
+        Args:
+            collection_name: Name of the collection
+            count: Number of IDs to reserve
+            
+        Returns:
+            List of reserved IDs, consecutive unless IDs are being handed
+            out concurrently
+        """
+        return list(itertools.islice(self._id_generator(collection_name), count))
+    
+    def _id_generator(self, collection_name: str) -> Iterator[int]:
+        """
+        Get a collection's ID counter, scanning the collections on first use.
+        
+        The scan is deferred so that connecting does not read the database
+        file; an unreadable file is then reported by the first operation.
+        """
+        shared = self._shared
+        generator = shared.id_generators.get(collection_name)
+        if generator is None:
+            with shared.id_lock:
+                # Another manager on the file may have loaded them meanwhile
+                if collection_name not in shared.id_generators:
+                    self._scan_id_generators()
+                generator = shared.id_generators[collection_name]
+        return generator
+    
+    def _load_id_generators(self) -> None:
+        """
+        Scan each collection once and start its IDs after the highest in use.
+        
+        Records inserted directly through the tables rather than through a
+        manager are only picked up by the next scan.
+        """
+        with self._shared.id_lock:
+            self._scan_id_generators()
+    
+    def _scan_id_generators(self) -> None:
+        """Set the shared ID counters from a table scan; needs the ID lock."""
+        for collection_name in self.COLLECTION_NAMES:
+            records = self.get_collection(collection_name).all()
+            max_id = max((record.get('id', 0) for record in records), default=0)
+            self._shared.id_generators[collection_name] = itertools.count(max_id + 1)
+    
+    def _is_empty(self, collection_name: str) -> bool:
+        """Check whether a collection has no records, without loading them."""
+        return len(self.get_collection(collection_name)) == 0
+    
+    def _observe_id(self, collection_name: str, record_id: Any) -> None:
+        """Advance a collection's ID counter past an explicitly supplied ID."""
+        if not isinstance(record_id, int):
+            return
+        self._id_generator(collection_name)
+        shared = self._shared
+        with shared.id_lock:
+            # A count cannot be inspected without taking a value, so this
+            # skips one ID when the supplied ID is already behind the counter
+            if record_id >= next(shared.id_generators[collection_name]):
+                shared.id_generators[collection_name] = itertools.count(record_id + 1)
+    
+    def __enter__(self) -> "DatabaseManager":
         """Context manager entry."""
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         self.close()
     
@@ -154,37 +689,7 @@ class DatabaseManager:
         Returns:
             List of user dictionaries with realistic data
         """
-        sample_users = [
-            {
-                "id": 1,
-                "name": "Alice Johnson",
-                "email": "alice.johnson@example.com",
-                "role": "Project Manager",
-                "created_at": "2024-01-15T09:00:00Z"
-            },
-            {
-                "id": 2,
-                "name": "Bob Smith",
-                "email": "bob.smith@example.com",
-                "role": "Software Developer",
-                "created_at": "2024-01-16T10:30:00Z"
-            },
-            {
-                "id": 3,
-                "name": "Carol Davis",
-                "email": "carol.davis@example.com",
-                "role": "QA Engineer",
-                "created_at": "2024-01-17T14:15:00Z"
-            },
-            {
-                "id": 4,
-                "name": "David Wilson",
-                "email": "david.wilson@example.com",
-                "role": "DevOps Engineer",
-                "created_at": "2024-01-18T11:45:00Z"
-            }
-        ]
-        return sample_users
+        return _copy_documents(_read_sample_data()["users"])
     
     def generate_sample_tasks(self) -> List[Dict[str, Any]]:
         """
@@ -193,69 +698,7 @@ class DatabaseManager:
         Returns:
             List of task dictionaries with user assignments
         """
-        sample_tasks = [
-            {
-                "id": 1,
-                "title": "Implement user authentication",
-                "description": "Create login and registration functionality with JWT tokens",
-                "assigned_to": 2,  # Bob Smith
-                "status": "in_progress",
-                "priority": "high",
-                "created_at": "2024-01-20T09:00:00Z",
-                "due_date": "2024-02-15T17:00:00Z"
-            },
-            {
-                "id": 2,
-                "title": "Design database schema",
-                "description": "Create comprehensive database design for the application",
-                "assigned_to": 1,  # Alice Johnson
-                "status": "completed",
-                "priority": "high",
-                "created_at": "2024-01-18T10:00:00Z",
-                "due_date": "2024-01-25T17:00:00Z"
-            },
-            {
-                "id": 3,
-                "title": "Write unit tests for API endpoints",
-                "description": "Create comprehensive test suite for all REST API endpoints",
-                "assigned_to": 3,  # Carol Davis
-                "status": "pending",
-                "priority": "medium",
-                "created_at": "2024-01-22T11:30:00Z",
-                "due_date": "2024-02-20T17:00:00Z"
-            },
-            {
-                "id": 4,
-                "title": "Set up CI/CD pipeline",
-                "description": "Configure automated testing and deployment pipeline",
-                "assigned_to": 4,  # David Wilson
-                "status": "in_progress",
-                "priority": "medium",
-                "created_at": "2024-01-21T14:00:00Z",
-                "due_date": "2024-02-10T17:00:00Z"
-            },
-            {
-                "id": 5,
-                "title": "Create user documentation",
-                "description": "Write comprehensive user guide and API documentation",
-                "assigned_to": 1,  # Alice Johnson
-                "status": "pending",
-                "priority": "low",
-                "created_at": "2024-01-23T16:00:00Z",
-                "due_date": "2024-03-01T17:00:00Z"
-            },
-            {
-                "id": 6,
-                "title": "Performance optimization",
-                "description": "Optimize database queries and API response times",
-                "assigned_to": 2,  # Bob Smith
-                "status": "pending",
-                "priority": "medium",
-                "created_at": "2024-01-24T13:00:00Z",
-                "due_date": "2024-02-28T17:00:00Z"
-            }
-        ]
-        return sample_tasks
+        return _copy_documents(_read_sample_data()["tasks"])
     
     def generate_sample_products(self) -> List[Dict[str, Any]]:
         """
@@ -264,54 +707,7 @@ class DatabaseManager:
         Returns:
             List of product dictionaries with pricing
         """
-        sample_products = [
-            {
-                "id": 1,
-                "name": "Wireless Bluetooth Headphones",
-                "description": "High-quality wireless headphones with noise cancellation",
-                "price": 199.99,
-                "category": "Electronics",
-                "in_stock": True,
-                "created_at": "2024-01-10T12:00:00Z"
-            },
-            {
-                "id": 2,
-                "name": "Ergonomic Office Chair",
-                "description": "Comfortable office chair with lumbar support and adjustable height",
-                "price": 349.99,
-                "category": "Furniture",
-                "in_stock": True,
-                "created_at": "2024-01-11T15:30:00Z"
-            },
-            {
-                "id": 3,
-                "name": "Mechanical Keyboard",
-                "description": "RGB backlit mechanical keyboard with blue switches",
-                "price": 129.99,
-                "category": "Electronics",
-                "in_stock": False,
-                "created_at": "2024-01-12T10:15:00Z"
-            },
-            {
-                "id": 4,
-                "name": "Standing Desk Converter",
-                "description": "Adjustable standing desk converter for healthier work habits",
-                "price": 299.99,
-                "category": "Furniture",
-                "in_stock": True,
-                "created_at": "2024-01-13T14:45:00Z"
-            },
-            {
-                "id": 5,
-                "name": "4K Webcam",
-                "description": "Ultra HD webcam with auto-focus and built-in microphone",
-                "price": 89.99,
-                "category": "Electronics",
-                "in_stock": True,
-                "created_at": "2024-01-14T11:20:00Z"
-            }
-        ]
-        return sample_products
+        return _copy_documents(_read_sample_data()["products"])
     
     def initialize_sample_data(self, force_reset: bool = False) -> Dict[str, int]:
         """
@@ -323,6 +719,19 @@ class DatabaseManager:
         Returns:
             Dictionary with count of records inserted for each collection
         """
+        with _seed_lock:
+            # Keep the truncates and inserts in memory, then write the
+            # database file once at the end
+            storage = self.db.storage
+            storage.deferred = True
+            try:
+                return self._initialize_sample_data(force_reset)
+            finally:
+                storage.deferred = False
+                storage.sync()
+    
+    def _initialize_sample_data(self, force_reset: bool) -> Dict[str, int]:
+        """Seed the sample data; called with the seed lock held."""
         try:
             result = {"users": 0, "tasks": 0, "products": 0}
             
@@ -331,42 +740,82 @@ class DatabaseManager:
                 self.users.truncate()
                 self.tasks.truncate()
                 self.products.truncate()
+                self._invalidate_user_exists('users')
                 self.logger.info("Cleared existing data from all collections")
             
-            # Initialize users collection
-            if len(self.users.all()) == 0:
-                sample_users = self.generate_sample_users()
-                self.users.insert_multiple(sample_users)
-                result["users"] = len(sample_users)
-                self.logger.info(f"Inserted {len(sample_users)} sample users")
-            else:
-                self.logger.info("Users collection already has data, skipping initialization")
-            
-            # Initialize tasks collection
-            if len(self.tasks.all()) == 0:
-                sample_tasks = self.generate_sample_tasks()
-                self.tasks.insert_multiple(sample_tasks)
-                result["tasks"] = len(sample_tasks)
-                self.logger.info(f"Inserted {len(sample_tasks)} sample tasks")
-            else:
-                self.logger.info("Tasks collection already has data, skipping initialization")
-            
-            # Initialize products collection
-            if len(self.products.all()) == 0:
-                sample_products = self.generate_sample_products()
-                self.products.insert_multiple(sample_products)
-                result["products"] = len(sample_products)
-                self.logger.info(f"Inserted {len(sample_products)} sample products")
-            else:
-                self.logger.info("Products collection already has data, skipping initialization")
+            # Find the empty collections before building any sample documents
+            collections_to_seed = [
+                collection_name for collection_name in result
+                if self._is_empty(collection_name)
+            ]
+            
+            # Group the sample documents by collection first so each collection
+            # is seeded with a single bulk insert
+            generators = {
+                "users": self.generate_sample_users,
+                "tasks": self.generate_sample_tasks,
+                "products": self.generate_sample_products
+            }
+            sample_data = {
+                collection_name: generators[collection_name]()
+                for collection_name in collections_to_seed
+            }
+            
+            batch_size = get_init_batch_size()
+            
+            for collection_name in result:
+                documents = sample_data.get(collection_name)
+                if documents is None:
+                    self.logger.info("%s collection already has data, skipping initialization", collection_name.capitalize())
+                    continue
+                
+                result[collection_name] = self._seed_collection(collection_name, documents, batch_size)
+                self.logger.info("Inserted %s sample %s", result[collection_name], collection_name)
+            
+            # Seeded records bring their own IDs
+            if force_reset or collections_to_seed:
+                self._load_id_generators()
             
             self.logger.info("Sample data initialization completed successfully")
             return result
             
         except Exception as e:
-            self.logger.error(f"Error initializing sample data: {str(e)}")
+            self.logger.error("Error initializing sample data: %s", e)
             raise
     
+    def _seed_collection(self, collection_name: str, documents: Iterable[Dict[str, Any]], batch_size: int) -> int:
+        """
+        Insert sample documents into one collection in batches.
+        
+        Documents are pulled from the iterable one batch at a time, so a
+        generator source never has to be held in memory all at once.
+        
+        Args:
+            collection_name: Name of the collection to seed
+            documents: Sample documents to insert
+            batch_size: Maximum number of documents per insert
+            
+        Returns:
+            Number of documents inserted
+        """
+        collection = self.get_collection(collection_name)
+        documents = iter(documents)
+        inserted = 0
+        
+        while True:
+            batch = list(itertools.islice(documents, batch_size))
+            if not batch:
+                break
+            
+            started = time.perf_counter()
+            batch_inserted = len(collection.insert_multiple(batch))
+            inserted += batch_inserted
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.logger.debug("Inserted batch of %d %s in %.2f ms", batch_inserted, collection_name, elapsed_ms)
+        
+        self._invalidate_user_exists(collection_name)
+        return inserted
+    
     def create_record(self, collection_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new record in the specified collection.
@@ -386,24 +835,31 @@ class DatabaseManager:
             # Validate collection name
             collection = self.get_collection(collection_name)
             
+            # Work on a copy so the caller's dictionary is not modified
+            if isinstance(data, dict):
+                data = dict(data)
+            
             # Validate and prepare data
             validated_data = self._validate_create_data(collection_name, data)
             
             # Auto-generate ID if not provided
             if 'id' not in validated_data or validated_data['id'] is None:
                 validated_data['id'] = self.get_next_id(collection_name)
+            else:
+                self._observe_id(collection_name, validated_data['id'])
             
             # Add created_at timestamp if not provided
             if 'created_at' not in validated_data:
-                validated_data['created_at'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+                validated_data['created_at'] = _utc_now_iso()
             
             # Insert the record
             doc_id = collection.insert(validated_data)
+            self._invalidate_user_exists(collection_name)
             
             # Retrieve the inserted record
             inserted_record = collection.get(doc_id=doc_id)
             
-            self.logger.info(f"Successfully created record in {collection_name} with ID {validated_data['id']}")
+            self.logger.info("Successfully created record in %s with ID %s", collection_name, validated_data['id'])
             
             return {
                 "success": True,
@@ -424,16 +880,103 @@ class DatabaseManager:
                 "error": error_msg
             }
     
+    def create_records_bulk(self, collection_name: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create several records in the specified collection with a single insert.
+        
+        Every record is validated before anything is written, so either all
+        records are created or none are. Records without an ID are given
+        consecutive IDs.
+        
+        Args:
+            collection_name: Name of the collection ('users', 'tasks', 'products')
+            records: List of dictionaries containing the record data
+            
+        Returns:
+            Dictionary with operation result including the created records
+            
+        Raises:
+            ValueError: If collection name is invalid or data validation fails
+            ConnectionError: If database is not connected
+        """
+        try:
+            # Validate collection name
+            collection = self.get_collection(collection_name)
+            
+            if not isinstance(records, list):
+                raise ValueError("Records must be a list")
+            
+            if not records:
+                raise ValueError("Records cannot be empty")
+            
+            # Work on copies so the callers' dictionaries are not modified
+            records = [dict(data) if isinstance(data, dict) else data for data in records]
+            
+            # Validate and prepare all records before inserting any
+            validated_records = [
+                self._validate_create_data(collection_name, data)
+                for data in records
+            ]
+            
+            # Advance past the explicitly supplied IDs first, so the IDs
+            # reserved for the other records cannot collide with them
+            missing_ids = []
+            explicit_ids = []
+            for validated_data in validated_records:
+                if validated_data.get('id') is None:
+                    missing_ids.append(validated_data)
+                elif isinstance(validated_data['id'], int):
+                    explicit_ids.append(validated_data['id'])
+            
+            if explicit_ids:
+                self._observe_id(collection_name, max(explicit_ids))
+            
+            reserved_ids = self._reserve_ids(collection_name, len(missing_ids))
+            for validated_data, record_id in zip(missing_ids, reserved_ids):
+                validated_data['id'] = record_id
+            
+            created_at = _utc_now_iso()
+            for validated_data in validated_records:
+                validated_data.setdefault('created_at', created_at)
+            
+            # Insert all records with a single write
+            collection.insert_multiple(validated_records)
+            self._invalidate_user_exists(collection_name)
+            
+            self.logger.info("Successfully created %s records in %s", len(validated_records), collection_name)
+            
+            return {
+                "success": True,
+                "data": validated_records,
+                "message": f"{len(validated_records)} records created successfully in {collection_name}",
+                "count": len(validated_records),
+                "error": None
+            }
+            
+        except Exception as e:
+            error_msg = f"Failed to create records in {collection_name}: {str(e)}"
+            self.logger.error(error_msg)
+            return {
+                "success": False,
+                "data": [],
+                "message": "Bulk record creation failed",
+                "count": 0,
+                "error": error_msg
+            }
+    
     def _validate_create_data(self, collection_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate data for record creation based on collection schema.
         
+        The data is validated and given its defaults in place, so callers
+        pass a copy when the original must stay untouched.
+        
         Args:
             collection_name: Name of the collection
             data: Data to validate
             
         Returns:
-            Validated and cleaned data dictionary
+            The same dictionary, validated and with defaults filled in
             
         Raises:
             ValueError: If validation fails
@@ -444,19 +987,12 @@ class DatabaseManager:
         if not data:
             raise ValueError("Data cannot be empty")
         
-        # Make a copy to avoid modifying the original
-        validated_data = data.copy()
-        
-        # Collection-specific validation
-        if collection_name == 'users':
-            return self._validate_user_data(validated_data)
-        elif collection_name == 'tasks':
-            return self._validate_task_data(validated_data)
-        elif collection_name == 'products':
-            return self._validate_product_data(validated_data)
-        else:
-            # Generic validation for unknown collections
-            return validated_data
+        # Collection-specific validation; unknown collections get only the
+        # generic checks above
+        handler_name = self._CREATE_VALIDATORS.get(collection_name)
+        if handler_name is None:
+            return data
+        return getattr(self, handler_name)(data)
     
     def _validate_user_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate user data according to schema."""
@@ -468,7 +1004,7 @@ class DatabaseManager:
         
         # Validate email format (basic check)
         email = data['email']
-        if '@' not in email or '.' not in email.split('@')[-1]:
+        if not _EMAIL_RE.fullmatch(email):
             raise ValueError("Invalid email format")
         
         # Set default role if not provided
@@ -493,14 +1029,12 @@ class DatabaseManager:
             data['priority'] = 'medium'
         
         # Validate status values
-        valid_statuses = ['pending', 'in_progress', 'completed', 'cancelled', 'archived']
-        if data['status'] not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {valid_statuses}")
+        if not _is_one_of(data['status'], _VALID_TASK_STATUSES):
+            raise ValueError(f"Invalid status. {_STATUS_CHOICES_MSG}")
         
         # Validate priority values
-        valid_priorities = ['low', 'medium', 'high', 'urgent']
-        if data['priority'] not in valid_priorities:
-            raise ValueError(f"Invalid priority. Must be one of: {valid_priorities}")
+        if not _is_one_of(data['priority'], _VALID_TASK_PRIORITIES):
+            raise ValueError(f"Invalid priority. {_PRIORITY_CHOICES_MSG}")
         
         # Validate assigned_to if provided
         if 'assigned_to' in data and data['assigned_to'] is not None:
@@ -562,7 +1096,7 @@ class DatabaseManager:
             else:
                 records = collection.all()
             
-            self.logger.info(f"Successfully read {len(records)} records from {collection_name}")
+            self.logger.info("Successfully read %s records from %s", len(records), collection_name)
             
             return {
                 "success": True,
@@ -583,51 +1117,110 @@ class DatabaseManager:
                 "error": error_msg
             }
     
-    def _apply_filters(self, collection: Table, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _apply_filters(self, collection: Table, filters: Dict[str, Any], legacy_fallback: bool = True) -> List[Dict[str, Any]]:
         """
         Apply filter criteria to a collection query using advanced query parser.
         
         Args:
             collection: TinyDB table to query
             filters: Dictionary of filter criteria (supports advanced syntax)
+            legacy_fallback: If False, raise ValueError for filters the
+                advanced parser rejects instead of trying legacy parsing
             
         Returns:
             List of records matching the filter criteria
         """
-        if not filters:
-            return collection.all()
-        
         try:
-            # Use the advanced query parser to build the query
-            parsed_query = self.query_parser.parse_query(filters)
+            query = self._build_query(filters, legacy_fallback)
             
-            if parsed_query is None:
+            if query is None:
                 return collection.all()
             
-            return collection.search(parsed_query)
+            return collection.search(query)
             
-        except ValueError as e:
-            # If advanced parsing fails, fall back to legacy parsing for backward compatibility
-            self.logger.warning(f"Advanced query parsing failed, falling back to legacy: {str(e)}")
-            return self._apply_legacy_filters(collection, filters)
         except Exception as e:
-            self.logger.error(f"Query execution failed: {str(e)}")
+            self.logger.error("Query execution failed: %s", e)
             raise
     
-    def _apply_legacy_filters(self, collection: Table, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _build_query(self, filters: Dict[str, Any], legacy_fallback: bool = True) -> Optional[Any]:
         """
-        Legacy filter application for backward compatibility.
+        Build a TinyDB query from filter criteria using advanced query parser.
+        
+        Args:
+            filters: Dictionary of filter criteria (supports advanced syntax)
+            legacy_fallback: If False, raise ValueError for filters the
+                advanced parser rejects instead of trying legacy parsing
+            
+        Returns:
+            TinyDB query, or None if every record matches
+            
+        Raises:
+            ValueError: If the filters cannot be parsed
+        """
+        if not filters:
+            return None
+        
+        # Reuse the query built for an identical filter, e.g. when the same
+        # dashboard filter is polled repeatedly. Parsing is what validates
+        # the filter, so a cache hit also skips validation.
+        try:
+            key = _freeze_filters(filters)
+        except TypeError:
+            return self._parse_filters(filters, legacy_fallback)[0]
+        
+        cached = self._query_cache.get(key)
+        if cached is None:
+            cached = self._parse_filters(filters, legacy_fallback)
+            if len(self._query_cache) >= QUERY_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._query_cache[next(iter(self._query_cache))]
+            self._query_cache[key] = cached
+        
+        query, is_legacy = cached
+        if is_legacy and not legacy_fallback:
+            # Only the legacy parser accepted this filter; parse it again
+            # to raise the advanced parser's error
+            self.query_parser.parse_query(filters)
+        return query
+    
+    def _parse_filters(self, filters: Dict[str, Any], legacy_fallback: bool = True) -> tuple:
+        """
+        Parse filter criteria into a TinyDB query, without caching.
+        
+        Args:
+            filters: Non-empty dictionary of filter criteria
+            legacy_fallback: If False, raise ValueError for filters the
+                advanced parser rejects instead of trying legacy parsing
+            
+        Returns:
+            Tuple of the TinyDB query matching the filter criteria and
+            whether the legacy parser built it
+            
+        Raises:
+            ValueError: If the filters cannot be parsed
+        """
+        try:
+            return self.query_parser.parse_query(filters), False
+        except ValueError as e:
+            if not legacy_fallback:
+                raise
+            # If advanced parsing fails, fall back to legacy parsing for backward compatibility
+            self.logger.warning("Advanced query parsing failed, falling back to legacy: %s", e)
+            return self._build_legacy_query(filters), True
+    
+    def _build_legacy_query(self, filters: Dict[str, Any]) -> Any:
+        """
+        Legacy query building for backward compatibility.
         
         Args:
-            collection: TinyDB table to query
             filters: Dictionary of filter criteria
             
         Returns:
-            List of records matching the filter criteria
+            TinyDB query matching all of the filter criteria
         """
         # Build query conditions using the old method
         query_conditions = []
-        Query_obj = Query()
+        Query_obj = self._query
         
         for field, value in filters.items():
             if isinstance(value, dict):
@@ -638,14 +1231,9 @@ class DatabaseManager:
                 query_conditions.append(Query_obj[field] == value)
         
         # Combine all conditions with AND logic
-        if len(query_conditions) == 1:
-            final_query = query_conditions[0]
-        else:
-            final_query = query_conditions[0]
-            for condition in query_conditions[1:]:
-                final_query = final_query & condition
+        final_query = reduce(and_, query_conditions)
         
-        return collection.search(final_query)
+        return final_query
     
     def _parse_complex_filter(self, Query_obj: Query, field: str, filter_spec: Dict[str, Any]) -> List:
         """
@@ -660,46 +1248,17 @@ class DatabaseManager:
             List of query conditions
         """
         conditions = []
+        field_query = Query_obj[field]
         
         for operator, value in filter_spec.items():
-            if operator == 'eq' or operator == 'equals':
-                conditions.append(Query_obj[field] == value)
-            elif operator == 'ne' or operator == 'not_equals':
-                conditions.append(Query_obj[field] != value)
-            elif operator == 'gt' or operator == 'greater_than':
-                conditions.append(Query_obj[field] > value)
-            elif operator == 'gte' or operator == 'greater_than_or_equal':
-                conditions.append(Query_obj[field] >= value)
-            elif operator == 'lt' or operator == 'less_than':
-                conditions.append(Query_obj[field] < value)
-            elif operator == 'lte' or operator == 'less_than_or_equal':
-                conditions.append(Query_obj[field] <= value)
-            elif operator == 'contains':
-                conditions.append(Query_obj[field].search(value))
-            elif operator == 'in':
-                if isinstance(value, list):
-                    # Create OR condition for multiple values
-                    in_conditions = [Query_obj[field] == v for v in value]
-                    if len(in_conditions) == 1:
-                        conditions.append(in_conditions[0])
-                    else:
-                        in_query = in_conditions[0]
-                        for cond in in_conditions[1:]:
-                            in_query = in_query | cond
-                        conditions.append(in_query)
-                else:
-                    conditions.append(Query_obj[field] == value)
-            elif operator == 'exists':
-                if value:
-                    conditions.append(Query_obj[field].exists())
-                else:
-                    conditions.append(~Query_obj[field].exists())
-            else:
+            build_condition = _FILTER_OPERATORS.get(operator)
+            if build_condition is None:
                 raise ValueError(f"Unsupported filter operator: {operator}")
+            conditions.append(build_condition(field_query, value))
         
         return conditions
     
-    def update_records(self, collection_name: str, filters: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    def update_records(self, collection_name: str, filters: Dict[str, Any], updates: Dict[str, Any], return_records: bool = False) -> Dict[str, Any]:
         """
         Update records in the specified collection based on filter criteria.
         
@@ -707,6 +1266,8 @@ class DatabaseManager:
             collection_name: Name of the collection ('users', 'tasks', 'products')
             filters: Dictionary of filter criteria to identify records to update
             updates: Dictionary of field updates to apply
+            return_records: If True, include the updated records in the result;
+                otherwise only the count is returned
             
         Returns:
             Dictionary with operation result including count of updated records
@@ -730,7 +1291,7 @@ class DatabaseManager:
             matching_records = self._apply_filters(collection, filters)
             
             if not matching_records:
-                self.logger.info(f"No records found matching filters in {collection_name}")
+                self.logger.info("No records found matching filters in %s", collection_name)
                 return {
                     "success": True,
                     "data": [],
@@ -739,32 +1300,20 @@ class DatabaseManager:
                     "error": None
                 }
             
-            # Build query for update
-            query_conditions = []
-            Query_obj = Query()
-            
-            for field, value in filters.items():
-                if isinstance(value, dict):
-                    query_conditions.extend(self._parse_complex_filter(Query_obj, field, value))
-                else:
-                    query_conditions.append(Query_obj[field] == value)
-            
-            # Combine conditions with AND logic
-            if len(query_conditions) == 1:
-                final_query = query_conditions[0]
-            else:
-                final_query = query_conditions[0]
-                for condition in query_conditions[1:]:
-                    final_query = final_query & condition
+            # Update exactly the matched documents by ID rather than
+            # evaluating the filters against the table again
+            updated_doc_ids = collection.update(
+                validated_updates,
+                doc_ids=[record.doc_id for record in matching_records]
+            )
+            updated_count = len(updated_doc_ids)
             
-            # Perform the update
-            updated_doc_ids = collection.update(validated_updates, final_query)
-            updated_count = len(updated_doc_ids) if isinstance(updated_doc_ids, list) else updated_doc_ids
+            # Get updated records for response only when asked to
+            updated_records = []
+            if return_records:
+                updated_records = [collection.get(doc_id=doc_id) for doc_id in updated_doc_ids]
             
-            # Get updated records for response
-            updated_records = self._apply_filters(collection, filters)
-            
-            self.logger.info(f"Successfully updated {updated_count} records in {collection_name}")
+            self.logger.info("Successfully updated %s records in %s", updated_count, collection_name)
             
             return {
                 "success": True,
@@ -805,34 +1354,29 @@ class DatabaseManager:
         if not updates:
             raise ValueError("Updates cannot be empty")
         
-        # Make a copy to avoid modifying the original
-        validated_updates = updates.copy()
-        
         # Don't allow updating ID field
-        if 'id' in validated_updates:
+        if 'id' in updates:
             raise ValueError("Cannot update the 'id' field")
         
         # Don't allow updating created_at field
-        if 'created_at' in validated_updates:
+        if 'created_at' in updates:
             raise ValueError("Cannot update the 'created_at' field")
         
-        # Collection-specific validation
-        if collection_name == 'users':
-            return self._validate_user_update_data(validated_updates)
-        elif collection_name == 'tasks':
-            return self._validate_task_update_data(validated_updates)
-        elif collection_name == 'products':
-            return self._validate_product_update_data(validated_updates)
-        else:
-            # Generic validation for unknown collections
-            return validated_updates
+        # Collection-specific validation. The validators only copy the
+        # updates when they need to normalize a value, leaving the
+        # caller's dictionary untouched. Unknown collections get only the
+        # generic checks above
+        handler_name = self._UPDATE_VALIDATORS.get(collection_name)
+        if handler_name is None:
+            return updates
+        return getattr(self, handler_name)(updates)
     
     def _validate_user_update_data(self, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Validate user update data according to schema."""
         # Validate email format if provided
         if 'email' in updates and updates['email']:
             email = updates['email']
-            if '@' not in email or '.' not in email.split('@')[-1]:
+            if not _EMAIL_RE.fullmatch(email):
                 raise ValueError("Invalid email format")
         
         return updates
@@ -841,15 +1385,13 @@ class DatabaseManager:
         """Validate task update data according to schema."""
         # Validate status values if provided
         if 'status' in updates:
-            valid_statuses = ['pending', 'in_progress', 'completed', 'cancelled', 'archived']
-            if updates['status'] not in valid_statuses:
-                raise ValueError(f"Invalid status. Must be one of: {valid_statuses}")
+            if not _is_one_of(updates['status'], _VALID_TASK_STATUSES):
+                raise ValueError(f"Invalid status. {_STATUS_CHOICES_MSG}")
         
         # Validate priority values if provided
         if 'priority' in updates:
-            valid_priorities = ['low', 'medium', 'high', 'urgent']
-            if updates['priority'] not in valid_priorities:
-                raise ValueError(f"Invalid priority. Must be one of: {valid_priorities}")
+            if not _is_one_of(updates['priority'], _VALID_TASK_PRIORITIES):
+                raise ValueError(f"Invalid priority. {_PRIORITY_CHOICES_MSG}")
         
         # Validate assigned_to if provided
         if 'assigned_to' in updates and updates['assigned_to'] is not None:
@@ -870,7 +1412,7 @@ class DatabaseManager:
             if price < 0:
                 raise ValueError("Price cannot be negative")
             
-            updates['price'] = price
+            updates = {**updates, 'price': price}
         
         return updates
     
@@ -902,7 +1444,7 @@ class DatabaseManager:
             matching_records = self._apply_filters(collection, filters)
             
             if not matching_records:
-                self.logger.info(f"No records found matching filters in {collection_name}")
+                self.logger.info("No records found matching filters in %s", collection_name)
                 return {
                     "success": True,
                     "data": [],
@@ -913,24 +1455,26 @@ class DatabaseManager:
             
             # Safety check for bulk deletions
             if len(matching_records) > 10:
-                self.logger.warning(f"Attempting to delete {len(matching_records)} records from {collection_name}")
+                self.logger.warning("Attempting to delete %s records from %s", len(matching_records), collection_name)
                 # Could add additional confirmation logic here if needed
             
-            # Store records for response before deletion
-            records_to_delete = matching_records.copy()
+            # Act on the documents already found rather than scanning the
+            # table a second time with the same query
+            doc_ids = [record.doc_id for record in matching_records]
             
             if soft_delete:
                 # Soft delete: mark records as deleted
-                deleted_count = self._perform_soft_delete(collection, filters)
+                deleted_count = self._perform_soft_delete(collection, doc_ids)
             else:
                 # Hard delete: remove records completely
-                deleted_count = self._perform_hard_delete(collection, filters)
+                deleted_count = self._perform_hard_delete(collection, doc_ids)
+            self._invalidate_user_exists(collection_name)
             
-            self.logger.info(f"Successfully deleted {deleted_count} records from {collection_name}")
+            self.logger.info("Successfully deleted %s records from %s", deleted_count, collection_name)
             
             return {
                 "success": True,
-                "data": records_to_delete,
+                "data": matching_records,
                 "message": f"Successfully deleted {deleted_count} records from {collection_name}",
                 "count": deleted_count,
                 "error": None
@@ -947,75 +1491,38 @@ class DatabaseManager:
                 "error": error_msg
             }
     
-    def _perform_hard_delete(self, collection: Table, filters: Dict[str, Any]) -> int:
+    def _perform_hard_delete(self, collection: Table, doc_ids: List[int]) -> int:
         """
-        Perform hard deletion of records matching the filters.
+        Perform hard deletion of the given documents.
         
         Args:
             collection: TinyDB table to delete from
-            filters: Filter criteria
+            doc_ids: TinyDB document IDs of the records to delete
             
         Returns:
             Number of records deleted
         """
-        # Build query conditions
-        query_conditions = []
-        Query_obj = Query()
-        
-        for field, value in filters.items():
-            if isinstance(value, dict):
-                query_conditions.extend(self._parse_complex_filter(Query_obj, field, value))
-            else:
-                query_conditions.append(Query_obj[field] == value)
-        
-        # Combine conditions with AND logic
-        if len(query_conditions) == 1:
-            final_query = query_conditions[0]
-        else:
-            final_query = query_conditions[0]
-            for condition in query_conditions[1:]:
-                final_query = final_query & condition
-        
-        # Perform the deletion
-        deleted_doc_ids = collection.remove(final_query)
+        deleted_doc_ids = collection.remove(doc_ids=doc_ids)
         return len(deleted_doc_ids) if isinstance(deleted_doc_ids, list) else deleted_doc_ids
     
-    def _perform_soft_delete(self, collection: Table, filters: Dict[str, Any]) -> int:
+    def _perform_soft_delete(self, collection: Table, doc_ids: List[int]) -> int:
         """
-        Perform soft deletion of records matching the filters.
+        Perform soft deletion of the given documents.
         
         Args:
             collection: TinyDB table to update
-            filters: Filter criteria
+            doc_ids: TinyDB document IDs of the records to soft-delete
             
         Returns:
             Number of records soft-deleted
         """
-        # Build query conditions
-        query_conditions = []
-        Query_obj = Query()
-        
-        for field, value in filters.items():
-            if isinstance(value, dict):
-                query_conditions.extend(self._parse_complex_filter(Query_obj, field, value))
-            else:
-                query_conditions.append(Query_obj[field] == value)
-        
-        # Combine conditions with AND logic
-        if len(query_conditions) == 1:
-            final_query = query_conditions[0]
-        else:
-            final_query = query_conditions[0]
-            for condition in query_conditions[1:]:
-                final_query = final_query & condition
-        
         # Mark records as deleted
         soft_delete_data = {
             'deleted': True,
-            'deleted_at': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            'deleted_at': _utc_now_iso()
         }
         
-        updated_doc_ids = collection.update(soft_delete_data, final_query)
+        updated_doc_ids = collection.update(soft_delete_data, doc_ids=doc_ids)
         return len(updated_doc_ids) if isinstance(updated_doc_ids, list) else updated_doc_ids   
  
     def advanced_search(self, collection_name: str, query: Dict[str, Any]) -> Dict[str, Any]:
@@ -1038,14 +1545,11 @@ class DatabaseManager:
             # Validate collection name
             collection = self.get_collection(collection_name)
             
-            # Validate query syntax
-            if query:
-                self.query_parser.validate_query_syntax(query)
-            
-            # Execute the advanced search
-            matching_records = self._apply_filters(collection, query)
+            # Execute the advanced search. Building the query validates its
+            # syntax, and a repeated query reuses the parsed form
+            matching_records = self._apply_filters(collection, query, legacy_fallback=False)
             
-            self.logger.info(f"Advanced search found {len(matching_records)} records in {collection_name}")
+            self.logger.info("Advanced search found %s records in %s", len(matching_records), collection_name)
             
             return {
                 "success": True,
@@ -1072,9 +1576,17 @@ class DatabaseManager:
         """
         Get information about supported query capabilities.
         
+        The description is static, so it is built once per manager and the
+        same dictionary is returned on every call; callers must not modify it.
+        
         Returns:
             Dictionary describing supported operators and syntax
         """
+        return self._query_capabilities
+    
+    @functools.cached_property
+    def _query_capabilities(self) -> Dict[str, Any]:
+        """Build the description returned by get_query_capabilities."""
         return {
             "supported_operators": self.query_parser.get_supported_operators(),
             "syntax_examples": {
@@ -1127,7 +1639,7 @@ class DatabaseManager:
             # Validate user exists
             user_exists = self._validate_user_exists(user_id)
             if not user_exists:
-                self.logger.warning(f"User with ID {user_id} does not exist")
+                self.logger.warning("User with ID %s does not exist", user_id)
                 return {
                     "success": True,
                     "data": [],
@@ -1144,17 +1656,16 @@ class DatabaseManager:
             # Add status filter if provided
             if status_filter:
                 # Validate status
-                valid_statuses = ['pending', 'in_progress', 'completed', 'cancelled', 'archived']
-                if status_filter not in valid_statuses:
-                    raise ValueError(f"Invalid status filter. Must be one of: {valid_statuses}")
+                if not _is_one_of(status_filter, _VALID_TASK_STATUSES):
+                    raise ValueError(f"Invalid status filter. {_STATUS_CHOICES_MSG}")
                 query["status"] = status_filter
             
             # Execute the query
             result = self.read_records("tasks", query)
             
             if result["success"]:
-                self.logger.info(f"Found {result['count']} tasks for user {user_id}" + 
-                               (f" with status '{status_filter}'" if status_filter else ""))
+                self.logger.info("Found %s tasks for user %s (status filter: %s)",
+                                 result['count'], user_id, status_filter)
                 
                 return {
                     "success": True,
@@ -1222,18 +1733,9 @@ class DatabaseManager:
             
             tasks = all_tasks_result["data"]
             
-            # Group tasks by status
-            status_counts = {}
-            priority_counts = {}
-            
-            for task in tasks:
-                # Count by status
-                status = task.get("status", "unknown")
-                status_counts[status] = status_counts.get(status, 0) + 1
-                
-                # Count by priority
-                priority = task.get("priority", "unknown")
-                priority_counts[priority] = priority_counts.get(priority, 0) + 1
+            # Count tasks by status and by priority
+            status_counts = dict(Counter(task.get("status", "unknown") for task in tasks))
+            priority_counts = dict(Counter(task.get("priority", "unknown") for task in tasks))
             
             summary_data = {
                 "user_id": user_id,
@@ -1243,7 +1745,7 @@ class DatabaseManager:
                 "by_priority": priority_counts
             }
             
-            self.logger.info(f"Generated task summary for user {user_id}: {len(tasks)} total tasks")
+            self.logger.info("Generated task summary for user %s: %s total tasks", user_id, len(tasks))
             
             return {
                 "success": True,
@@ -1283,6 +1785,11 @@ class DatabaseManager:
             if not all(isinstance(uid, int) and uid > 0 for uid in user_ids):
                 raise ValueError("All user_ids must be positive integers")
             
+            if len(user_ids) == 1 and not status_filter:
+                # A single user's tasks need no query parsing or validation
+                tasks = self.get_collection("tasks").search(self._query.assigned_to == user_ids[0])
+                return self._group_tasks_by_user(user_ids, tasks, status_filter)
+            
             # Build query using advanced search
             if len(user_ids) == 1:
                 query = {"assigned_to": user_ids[0]}
@@ -1291,9 +1798,8 @@ class DatabaseManager:
             
             # Add status filter if provided
             if status_filter:
-                valid_statuses = ['pending', 'in_progress', 'completed', 'cancelled', 'archived']
-                if status_filter not in valid_statuses:
-                    raise ValueError(f"Invalid status filter. Must be one of: {valid_statuses}")
+                if not _is_one_of(status_filter, _VALID_TASK_STATUSES):
+                    raise ValueError(f"Invalid status filter. {_STATUS_CHOICES_MSG}")
                 
                 if len(user_ids) == 1:
                     query["status"] = status_filter
@@ -1309,28 +1815,7 @@ class DatabaseManager:
             result = self.advanced_search("tasks", query)
             
             if result["success"]:
-                # Group tasks by user
-                tasks_by_user = {}
-                for user_id in user_ids:
-                    tasks_by_user[user_id] = []
-                
-                for task in result["data"]:
-                    assigned_to = task.get("assigned_to")
-                    if assigned_to in user_ids:
-                        tasks_by_user[assigned_to].append(task)
-                
-                return {
-                    "success": True,
-                    "data": {
-                        "tasks_by_user": tasks_by_user,
-                        "total_tasks": result["count"],
-                        "user_ids": user_ids,
-                        "status_filter": status_filter
-                    },
-                    "message": f"Successfully retrieved tasks for {len(user_ids)} users",
-                    "count": result["count"],
-                    "error": None
-                }
+                return self._group_tasks_by_user(user_ids, result["data"], status_filter)
             else:
                 return result
                 
@@ -1345,22 +1830,75 @@ class DatabaseManager:
                 "error": error_msg
             }
     
+    def _group_tasks_by_user(self, user_ids: List[int], tasks: List[Dict[str, Any]], status_filter: Optional[str]) -> Dict[str, Any]:
+        """
+        Build the get_tasks_by_multiple_users result from the matched tasks.
+        
+        Args:
+            user_ids: List of user IDs the tasks were fetched for
+            tasks: Tasks assigned to those users
+            status_filter: Status the tasks were filtered by, if any
+            
+        Returns:
+            Dictionary with tasks grouped by user
+        """
+        # Look each assignee up in the dict rather than scanning the
+        # user_ids list per task
+        tasks_by_user = {user_id: [] for user_id in user_ids}
+        
+        for task in tasks:
+            user_tasks = tasks_by_user.get(task.get("assigned_to"))
+            if user_tasks is not None:
+                user_tasks.append(task)
+        
+        return {
+            "success": True,
+            "data": {
+                "tasks_by_user": tasks_by_user,
+                "total_tasks": len(tasks),
+                "user_ids": user_ids,
+                "status_filter": status_filter
+            },
+            "message": f"Successfully retrieved tasks for {len(user_ids)} users",
+            "count": len(tasks),
+            "error": None
+        }
+    
     def _validate_user_exists(self, user_id: int) -> bool:
         """
         Validate that a user exists in the database.
         
+        Results are reused for USER_EXISTS_TTL seconds, or until users are
+        created or deleted through this manager.
+        
         Args:
             user_id: ID of the user to validate
             
         Returns:
             True if user exists, False otherwise
         """
+        now = time.monotonic()
+        cached = self._user_exists_cache.get(user_id)
+        if cached is not None and now - cached[0] < USER_EXISTS_TTL:
+            return cached[1]
+        
         try:
-            user_result = self.read_records("users", {"id": user_id})
-            return user_result["success"] and user_result["count"] > 0
+            # contains() stops at the first match and builds no result
+            exists = self.get_collection("users").contains(self._query.id == user_id)
         except Exception as e:
-            self.logger.error(f"Error validating user existence: {str(e)}")
+            self.logger.error("Error validating user existence: %s", e)
             return False
+        
+        if user_id not in self._user_exists_cache and len(self._user_exists_cache) >= USER_EXISTS_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._user_exists_cache[next(iter(self._user_exists_cache))]
+        self._user_exists_cache[user_id] = (now, exists)
+        return exists
+    
+    def _invalidate_user_exists(self, collection_name: str) -> None:
+        """Forget cached user existence checks after users are written."""
+        if collection_name == 'users':
+            self._user_exists_cache.clear()
     
     def get_unassigned_tasks(self, status_filter: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -1374,7 +1912,7 @@ class DatabaseManager:
         """
         try:
             # Build query for unassigned tasks
-            query = {
+            unassigned = {
                 "$or": [
                     {"assigned_to": {"exists": False}},
                     {"assigned_to": None}
@@ -1383,16 +1921,14 @@ class DatabaseManager:
             
             # Add status filter if provided
             if status_filter:
-                valid_statuses = ['pending', 'in_progress', 'completed', 'cancelled', 'archived']
-                if status_filter not in valid_statuses:
-                    raise ValueError(f"Invalid status filter. Must be one of: {valid_statuses}")
+                if not _is_one_of(status_filter, _VALID_TASK_STATUSES):
+                    raise ValueError(f"Invalid status filter. {_STATUS_CHOICES_MSG}")
                 
-                query = {
-                    "$and": [
-                        query,
-                        {"status": status_filter}
-                    ]
-                }
+                # Test the single status equality first, so the AND stops
+                # before the two-branch OR for tasks in other statuses
+                query = {"$and": [{"status": status_filter}, unassigned]}
+            else:
+                query = unassigned
             
             # Execute advanced search
             result = self.advanced_search("tasks", query)
@@ -4,10 +4,54 @@ Supports logical operators (AND, OR, NOT) and comparison operators.
 """
 
 import logging
+from functools import reduce
+from operator import and_, or_
 from typing import Dict, List, Any, Union, Optional
 from tinydb import Query
 
 
+def _is_one_of(value: Any, allowed: frozenset) -> bool:
+    """Check set membership, treating unhashable values as not allowed."""
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+def _is_none_of(value: Any, excluded: frozenset) -> bool:
+    """Check set non-membership, treating unhashable values as not excluded."""
+    try:
+        return value not in excluded
+    except TypeError:
+        return True
+
+
+def membership_condition(field_query: Any, values: List[Any], exclude: bool = False) -> Any:
+    """
+    Build an 'in' (or 'not_in') condition for a field.
+    
+    The values are tested as one set lookup per record instead of a chain
+    of one equality test per value. Lists of unhashable values fall back
+    to the equality chain.
+    
+    Args:
+        field_query: TinyDB query for the field
+        values: Non-empty list of values to match
+        exclude: If True, match records whose value is none of the values
+        
+    Returns:
+        Query condition
+    """
+    try:
+        allowed = frozenset(values)
+    except TypeError:
+        if exclude:
+            return reduce(and_, [field_query != v for v in values])
+        return reduce(or_, [field_query == v for v in values])
+    
+    return field_query.test(_is_none_of if exclude else _is_one_of, allowed)
+
+
 class QueryParser:
     """
     Advanced query parser that converts complex filter expressions into TinyDB queries.
@@ -38,7 +82,7 @@ class QueryParser:
         try:
             return self._parse_expression(query_dict)
         except Exception as e:
-            self.logger.error(f"Query parsing failed: {str(e)}")
+            self.logger.error("Query parsing failed: %s", e)
             raise ValueError(f"Invalid query syntax: {str(e)}")
     
     def _parse_expression(self, expr: Dict[str, Any]) -> Any:
@@ -75,15 +119,8 @@ class QueryParser:
         if not conditions:
             raise ValueError("AND operation requires at least one condition")
         
-        if len(conditions) == 1:
-            return self._parse_expression(conditions[0])
-        
         # Combine all conditions with AND
-        result = self._parse_expression(conditions[0])
-        for condition in conditions[1:]:
-            result = result & self._parse_expression(condition)
-        
-        return result
+        return reduce(and_, map(self._parse_expression, conditions))
     
     def _parse_or_operation(self, conditions: List[Dict[str, Any]]) -> Any:
         """
@@ -98,15 +135,8 @@ class QueryParser:
         if not conditions:
             raise ValueError("OR operation requires at least one condition")
         
-        if len(conditions) == 1:
-            return self._parse_expression(conditions[0])
-        
         # Combine all conditions with OR
-        result = self._parse_expression(conditions[0])
-        for condition in conditions[1:]:
-            result = result | self._parse_expression(condition)
-        
-        return result
+        return reduce(or_, map(self._parse_expression, conditions))
     
     def _parse_not_operation(self, condition: Dict[str, Any]) -> Any:
         """
@@ -147,14 +177,7 @@ class QueryParser:
                 query_conditions.append(self.query_obj[field] == value)
         
         # Combine all field conditions with AND
-        if len(query_conditions) == 1:
-            return query_conditions[0]
-        
-        result = query_conditions[0]
-        for condition in query_conditions[1:]:
-            result = result & condition
-        
-        return result
+        return reduce(and_, query_conditions)
     
     def _parse_field_operators(self, field: str, operators: Dict[str, Any]) -> List[Any]:
         """
@@ -224,15 +247,7 @@ class QueryParser:
             if not value:
                 raise ValueError("'in' operator requires a non-empty list")
             
-            # Create OR condition for multiple values
-            in_conditions = [self.query_obj[field] == v for v in value]
-            if len(in_conditions) == 1:
-                return in_conditions[0]
-            
-            result = in_conditions[0]
-            for condition in in_conditions[1:]:
-                result = result | condition
-            return result
+            return membership_condition(self.query_obj[field], value)
         
         elif operator == 'not_in':
             if not isinstance(value, list):
@@ -240,15 +255,7 @@ class QueryParser:
             if not value:
                 raise ValueError("'not_in' operator requires a non-empty list")
             
-            # Create AND condition for exclusion of all values
-            not_in_conditions = [self.query_obj[field] != v for v in value]
-            if len(not_in_conditions) == 1:
-                return not_in_conditions[0]
-            
-            result = not_in_conditions[0]
-            for condition in not_in_conditions[1:]:
-                result = result & condition
-            return result
+            return membership_condition(self.query_obj[field], value, exclude=True)
         
         # Existence operators
         elif operator == 'exists':
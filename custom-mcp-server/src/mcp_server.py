@@ -211,7 +211,7 @@ class MCPServer:
                     raise ValueError("Updates must be a non-empty dictionary")
                 
                 # Perform the update operation
-                db_result = self.db_manager.update_records(collection, filters, updates)
+                db_result = self.db_manager.update_records(collection, filters, updates, return_records=True)
                 
                 # Format response using ResponseFormatter
                 formatted_response = ResponseFormatter.from_database_result(
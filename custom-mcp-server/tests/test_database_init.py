@@ -43,7 +43,7 @@ class TestDatabaseInitialization:
             assert 'format' in call_args.kwargs
             assert 'handlers' in call_args.kwargs
     
-    @patch('database.init_db.DatabaseManager')
+    @patch('database.manager.DatabaseManager')
     def test_main_successful_initialization(self, mock_db_manager_class):
         """Test successful database initialization."""
         # Mock database manager
@@ -76,7 +76,7 @@ class TestDatabaseInitialization:
         assert "tasks: 5 records" in output
         assert "products: 4 records" in output
     
-    @patch('database.init_db.DatabaseManager')
+    @patch('database.manager.DatabaseManager')
     def test_main_database_connection_failure(self, mock_db_manager_class):
         """Test handling of database connection failure."""
         # Mock database manager with connection failure
@@ -97,7 +97,7 @@ class TestDatabaseInitialization:
         # Verify initialization was not attempted
         mock_db_manager.initialize_sample_data.assert_not_called()
     
-    @patch('database.init_db.DatabaseManager')
+    @patch('database.manager.DatabaseManager')
     def test_main_initialization_exception(self, mock_db_manager_class):
         """Test handling of initialization exception."""
         # Mock database manager that raises exception
@@ -116,7 +116,7 @@ class TestDatabaseInitialization:
         # Verify exception was handled
         mock_db_manager.initialize_sample_data.assert_called_once()
     
-    @patch('database.init_db.DatabaseManager')
+    @patch('database.manager.DatabaseManager')
     def test_main_no_new_records(self, mock_db_manager_class):
         """Test initialization when database already contains data."""
         # Mock database manager with no new records
@@ -141,10 +141,10 @@ class TestDatabaseInitialization:
         assert "already contains data" in output.lower()
         assert "no new records inserted" in output.lower()
     
-    @patch('database.init_db.DatabaseManager')
+    @patch('database.manager.DatabaseManager')
     @patch('os.chdir')
-    def test_main_directory_change(self, mock_chdir, mock_db_manager_class):
-        """Test that main function changes to project root directory."""
+    def test_main_uses_project_root(self, mock_chdir, mock_db_manager_class):
+        """Test that main resolves the database against the project root without changing directory."""
         # Mock database manager
         mock_db_manager = MagicMock()
         mock_db_manager.is_connected.return_value = True
@@ -154,17 +154,18 @@ class TestDatabaseInitialization:
         # Execute main
         result = main()
         
-        # Verify directory was changed
-        mock_chdir.assert_called_once()
+        # Verify the working directory was left alone
+        assert result == 0
+        mock_chdir.assert_not_called()
         
         # Verify the path is reasonable (should be project root)
-        call_args = mock_chdir.call_args[0][0]
-        assert os.path.exists(call_args) or str(call_args).endswith('custom-mcp-server')
+        root = mock_db_manager_class.call_args.kwargs['root']
+        assert os.path.exists(root) or str(root).endswith('custom-mcp-server')
     
     def test_main_integration_with_real_database(self):
         """Integration test with real database manager."""
         # Use real database manager with temporary database
-        with patch('database.init_db.DatabaseManager') as mock_db_manager_class:
+        with patch('database.manager.DatabaseManager') as mock_db_manager_class:
             # Create real database manager with temp path
             real_db_manager = DatabaseManager(self.temp_db_path)
             mock_db_manager_class.return_value = real_db_manager
@@ -218,7 +219,7 @@ class TestDatabaseInitializationEdgeCases:
             # Make file read-only
             os.chmod(readonly_path, 0o444)
             
-            with patch('database.init_db.DatabaseManager') as mock_db_manager_class:
+            with patch('database.manager.DatabaseManager') as mock_db_manager_class:
                 # Create database manager that simulates permission error
                 mock_db_manager = MagicMock()
                 mock_db_manager.is_connected.return_value = True
@@ -239,7 +240,7 @@ class TestDatabaseInitializationEdgeCases:
     
     def test_initialization_with_disk_full_error(self):
         """Test initialization with disk full simulation."""
-        with patch('database.init_db.DatabaseManager') as mock_db_manager_class:
+        with patch('database.manager.DatabaseManager') as mock_db_manager_class:
             # Simulate disk full error
             mock_db_manager = MagicMock()
             mock_db_manager.is_connected.return_value = True
@@ -252,7 +253,7 @@ class TestDatabaseInitializationEdgeCases:
     
     def test_initialization_with_corrupted_database(self):
         """Test initialization with corrupted database."""
-        with patch('database.init_db.DatabaseManager') as mock_db_manager_class:
+        with patch('database.manager.DatabaseManager') as mock_db_manager_class:
             # Simulate corrupted database
             mock_db_manager = MagicMock()
             mock_db_manager.is_connected.return_value = False  # Connection fails due to corruption
@@ -262,7 +263,7 @@ class TestDatabaseInitializationEdgeCases:
             result = main()
             assert result == 1
     
-    @patch('database.init_db.DatabaseManager')
+    @patch('database.manager.DatabaseManager')
     def test_initialization_partial_success(self, mock_db_manager_class):
         """Test initialization with partial success."""
         # Mock database manager with partial success
@@ -308,20 +309,20 @@ class TestDatabaseInitializationEdgeCases:
         assert result == 1
     
     @patch('os.chdir')
-    def test_directory_change_error(self, mock_chdir):
-        """Test handling of directory change errors."""
+    def test_directory_change_not_required(self, mock_chdir):
+        """Test that initialization does not depend on changing directory."""
         # Mock chdir to raise exception
         mock_chdir.side_effect = OSError("Cannot change directory")
         
-        with patch('database.init_db.DatabaseManager') as mock_db_manager_class:
+        with patch('database.manager.DatabaseManager') as mock_db_manager_class:
             mock_db_manager = MagicMock()
             mock_db_manager.is_connected.return_value = True
             mock_db_manager.initialize_sample_data.return_value = {'users': 1}
             mock_db_manager_class.return_value = mock_db_manager
             
-            # Should handle directory change errors
+            # Should succeed without touching the working directory
             result = main()
-            assert result == 1
+            assert result == 0
 
 
 if __name__ == "__main__":
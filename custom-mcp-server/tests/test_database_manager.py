@@ -3,6 +3,7 @@ Unit tests for the DatabaseManager class.
 """
 
 import os
+import json
 import tempfile
 import pytest
 from pathlib import Path
@@ -63,16 +64,44 @@ class TestDatabaseManager:
         next_id = self.db_manager.get_next_id('users')
         assert next_id == 1
         
-        # Add a record and test again
-        self.db_manager.users.insert({'id': 1, 'name': 'Test User'})
+        # IDs keep increasing without a record being inserted
         next_id = self.db_manager.get_next_id('users')
         assert next_id == 2
         
-        # Add another record with higher ID
-        self.db_manager.users.insert({'id': 5, 'name': 'Test User 2'})
+        # Add a record with a higher explicit ID
+        self.db_manager.create_record('users', {'id': 5, 'name': 'Test User', 'email': 'test@example.com'})
         next_id = self.db_manager.get_next_id('users')
         assert next_id == 6
     
+    @pytest.mark.skipif(os.name == 'nt', reason="drive letters are valid on Windows")
+    def test_windows_drive_path_rejected(self):
+        """Test that a Windows drive path is rejected on other platforms."""
+        with pytest.raises(ConnectionError, match="not a valid path"):
+            DatabaseManager("Z:\\data\\db.json")
+    
+    @pytest.mark.skipif(os.name == 'nt', reason="colons are not allowed in Windows file names")
+    def test_colon_file_name_accepted(self, tmp_path):
+        """Test that a file name containing a colon is not taken for a drive."""
+        with DatabaseManager("x:data.json", root=tmp_path) as db:
+            assert db.db_path == str(tmp_path / "x:data.json")
+            assert db.is_connected()
+    
+    def test_next_id_loaded_from_existing_records(self):
+        """Test that ID counters start after the highest stored ID."""
+        self.db_manager.users.insert({'id': 7, 'name': 'Test User'})
+        
+        with DatabaseManager(self.temp_db.name) as db:
+            assert db.get_next_id('users') == 8
+            assert db.get_next_id('tasks') == 1
+    
+    def test_managers_on_same_file_share_ids(self):
+        """Test that managers using the same file never hand out the same ID."""
+        with DatabaseManager(self.temp_db.name) as other:
+            for db in (self.db_manager, other, self.db_manager):
+                db.create_record('users', {'name': 'Test User', 'email': 'test@example.com'})
+        
+        assert sorted(user['id'] for user in self.db_manager.users.all()) == [1, 2, 3]
+    
     def test_sample_data_generation(self):
         """Test sample data generation methods."""
         users = self.db_manager.generate_sample_users()
@@ -147,6 +176,60 @@ class TestDatabaseManager:
         assert result['users'] >= 3
         assert len(self.db_manager.users.all()) == initial_users
     
+    def test_initialize_sample_data_restores_sync(self):
+        """Test that deferred seeding writes are committed to the file."""
+        storage = self.db_manager.db.storage
+        result = self.db_manager.initialize_sample_data()
+        
+        assert storage.deferred is False
+        
+        # Seeded data has been written to the file
+        with open(self.temp_db.name) as f:
+            assert len(json.load(f)['users']) == result['users']
+    
+    def test_reads_pick_up_external_changes(self):
+        """Test that cached reads are refreshed when the file is rewritten."""
+        self.db_manager.initialize_sample_data()
+        assert len(self.db_manager.users) > 0
+        
+        # Rewrite the file behind the manager's back
+        with open(self.temp_db.name, 'w') as f:
+            json.dump({'users': {'1': {'id': 1, 'name': 'Only User'}}}, f)
+        
+        assert len(self.db_manager.users) == 1
+        assert len(self.db_manager.tasks) == 0
+    
+    def test_write_cache_buffers_until_flush(self, monkeypatch):
+        """Test that MCP_WRITE_CACHE_SIZE batches writes to the file."""
+        monkeypatch.setenv('MCP_WRITE_CACHE_SIZE', '10')
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
+        temp_db.close()
+        
+        try:
+            with DatabaseManager(temp_db.name) as db:
+                db.create_record('users', {'name': 'Buffered', 'email': 'buffered@example.com'})
+                
+                # Visible through the manager, not yet written to the file
+                assert len(db.users) == 1
+                assert os.path.getsize(temp_db.name) == 0
+                
+                db.flush()
+                with open(temp_db.name) as f:
+                    assert len(json.load(f)['users']) == 1
+        finally:
+            os.unlink(temp_db.name)
+    
+    def test_replaced_database_closed_by_last_holder(self):
+        """Test that an instance replaced after its file was removed is still closed."""
+        os.unlink(self.temp_db.name)
+        
+        with DatabaseManager(self.temp_db.name) as db:
+            assert db.db is not self.db_manager.db
+        
+        handle = self.db_manager.db.storage._handle
+        self.db_manager.close()
+        assert handle.closed
+    
     def test_context_manager(self):
         """Test DatabaseManager as context manager."""
         temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
@@ -167,6 +250,7 @@ class TestDatabaseManager:
             assert db_ref.users is None
             assert db_ref.tasks is None
             assert db_ref.products is None
+            assert not db_ref.is_connected()
         finally:
             try:
                 os.unlink(temp_db.name)
@@ -223,6 +307,7 @@ class TestDatabaseManager:
         
         assert result['success'] is True
         assert result['data']['role'] == 'User'  # Default role
+        assert user_data == {'name': 'Jane Doe', 'email': 'jane.doe@example.com'}
     
     def test_create_record_users_invalid_email(self):
         """Test user creation with invalid email."""
@@ -237,6 +322,14 @@ class TestDatabaseManager:
         assert result['count'] == 0
         assert 'Invalid email format' in result['error']
     
+    def test_create_record_users_malformed_emails(self):
+        """Test user creation rejects emails with whitespace or extra @ signs."""
+        for email in ['john doe@example.com', 'john@doe@example.com', '@example.com', 'john@example.']:
+            result = self.db_manager.create_record('users', {'name': 'John', 'email': email})
+            
+            assert result['success'] is False
+            assert 'Invalid email format' in result['error']
+    
     def test_create_record_users_missing_required_fields(self):
         """Test user creation with missing required fields."""
         # Missing name
@@ -582,6 +675,85 @@ class TestDatabaseManager:
         assert result['success'] is False
         assert 'Unsupported filter operator' in result['error']
     
+    def test_create_records_bulk(self):
+        """Test creating several records with one call."""
+        self.db_manager.create_record('tasks', {'title': 'Existing Task'})
+        
+        tasks = [
+            {'title': 'Bulk Task 1'},
+            {'title': 'Bulk Task 2', 'status': 'in_progress'},
+            {'title': 'Bulk Task 3', 'id': 10}
+        ]
+        result = self.db_manager.create_records_bulk('tasks', tasks)
+        
+        assert result['success'] is True
+        assert result['count'] == 3
+        # Generated IDs start after the explicit one
+        assert [task['id'] for task in result['data']] == [11, 12, 10]
+        assert all('created_at' in task for task in result['data'])
+        assert len(self.db_manager.tasks) == 4
+        
+        # The caller's dictionaries are left untouched
+        assert 'id' not in tasks[0]
+        
+        # Later IDs continue after the highest bulk-created one
+        assert self.db_manager.get_next_id('tasks') == 13
+    
+    def test_create_records_bulk_mixed_ids_do_not_collide(self):
+        """Test that generated IDs skip an explicit ID within the same batch."""
+        tasks = [
+            {'title': 'Bulk Task 1'},
+            {'title': 'Bulk Task 2', 'id': 2},
+            {'title': 'Bulk Task 3'}
+        ]
+        result = self.db_manager.create_records_bulk('tasks', tasks)
+        
+        assert result['success'] is True
+        ids = [task['id'] for task in result['data']]
+        assert len(set(ids)) == 3
+        assert ids[1] == 2
+    
+    def test_create_records_bulk_invalid_record(self):
+        """Test that one invalid record prevents the whole bulk insert."""
+        users = [
+            {'name': 'Valid User', 'email': 'valid@example.com'},
+            {'name': 'Invalid User', 'email': 'invalid-email'}
+        ]
+        result = self.db_manager.create_records_bulk('users', users)
+        
+        assert result['success'] is False
+        assert result['count'] == 0
+        assert 'Invalid email format' in result['error']
+        assert len(self.db_manager.users) == 0
+    
+    def test_create_records_bulk_empty(self):
+        """Test bulk creation with no records."""
+        result = self.db_manager.create_records_bulk('users', [])
+        
+        assert result['success'] is False
+        assert 'Records cannot be empty' in result['error']
+    
+    def test_build_query_reuses_identical_filters(self):
+        """Test that identical filters share one built query."""
+        query = self.db_manager._build_query({'status': 'pending', 'priority': {'in': ['high', 'urgent']}})
+        same_query = self.db_manager._build_query({'priority': {'in': ['high', 'urgent']}, 'status': 'pending'})
+        other_query = self.db_manager._build_query({'status': 'completed'})
+        
+        assert query is same_query
+        assert other_query is not query
+        assert self.db_manager._build_query({}) is None
+    
+    def test_advanced_search_rejects_cached_legacy_filter(self):
+        """Test that a filter only the legacy parser accepts stays invalid for advanced search."""
+        self.db_manager.create_record('tasks', {'title': 'Task', 'status': 'pending'})
+        filters = {'status': {'in': 'pending'}}
+        
+        assert self.db_manager.read_records('tasks', filters)['count'] == 1
+        
+        result = self.db_manager.advanced_search('tasks', filters)
+        assert result['success'] is False
+        assert "'in' operator requires a list" in result['error']
+    
     def test_update_records_single_field(self):
         """Test updating a single field in matching records."""
         # Create test data
@@ -592,7 +764,7 @@ class TestDatabaseManager:
         self.db_manager.create_record('users', user2)
         
         # Update role for Alice
-        result = self.db_manager.update_records('users', {'name': 'Alice'}, {'role': 'Admin'})
+        result = self.db_manager.update_records('users', {'name': 'Alice'}, {'role': 'Admin'}, return_records=True)
         
         assert result['success'] is True
         assert result['count'] == 1
@@ -611,7 +783,7 @@ class TestDatabaseManager:
         
         # Update multiple fields
         updates = {'status': 'in_progress', 'priority': 'high'}
-        result = self.db_manager.update_records('tasks', {'title': 'Test Task'}, updates)
+        result = self.db_manager.update_records('tasks', {'title': 'Test Task'}, updates, return_records=True)
         
         assert result['success'] is True
         assert result['count'] == 1
@@ -631,7 +803,7 @@ class TestDatabaseManager:
         self.db_manager.create_record('tasks', task3)
         
         # Update all pending tasks
-        result = self.db_manager.update_records('tasks', {'status': 'pending'}, {'status': 'in_progress'})
+        result = self.db_manager.update_records('tasks', {'status': 'pending'}, {'status': 'in_progress'}, return_records=True)
         
         assert result['success'] is True
         assert result['count'] == 2
@@ -672,7 +844,7 @@ class TestDatabaseManager:
         # Update electronics products with price > 100
         filters = {'category': 'Electronics', 'price': {'gt': 100.0}}
         updates = {'in_stock': False}
-        result = self.db_manager.update_records('products', filters, updates)
+        result = self.db_manager.update_records('products', filters, updates, return_records=True)
         
         assert result['success'] is True
         assert result['count'] == 1
@@ -686,7 +858,7 @@ class TestDatabaseManager:
         self.db_manager.create_record('users', user1)
         
         # Update only the role, leaving other fields unchanged
-        result = self.db_manager.update_records('users', {'name': 'Alice'}, {'role': 'Admin'})
+        result = self.db_manager.update_records('users', {'name': 'Alice'}, {'role': 'Admin'}, return_records=True)
         
         assert result['success'] is True
         assert result['count'] == 1
@@ -784,6 +956,13 @@ class TestDatabaseManager:
         result = self.db_manager.update_records('products', {'name': 'Test Product'}, {'price': 'not_a_number'})
         assert result['success'] is False
         assert 'Price must be a valid number' in result['error']
+        
+        # A coerced price is stored without changing the caller's updates
+        updates = {'price': '12'}
+        result = self.db_manager.update_records('products', {'name': 'Test Product'}, updates, return_records=True)
+        assert result['success'] is True
+        assert result['data'][0]['price'] == 12.0
+        assert updates == {'price': '12'}
     
     def test_delete_records_single_record(self):
         """Test deleting a single record."""
@@ -65,7 +65,8 @@ class TestEndToEndCRUDWorkflows:
         update_result = self.db_manager.update_records(
             "users",
             {"id": user_id},
-            {"role": "Senior Tester", "email": "senior.integration@test.com"}
+            {"role": "Senior Tester", "email": "senior.integration@test.com"},
+            return_records=True
         )
         TestUtilities.assert_response_structure(update_result, success=True)
         assert update_result["count"] == 1
@@ -118,7 +119,8 @@ class TestEndToEndCRUDWorkflows:
             update_result = self.db_manager.update_records(
                 "tasks",
                 {"id": task_id},
-                {"status": status}
+                {"status": status},
+                return_records=True
             )
             TestUtilities.assert_response_structure(update_result, success=True)
             assert update_result["data"][0]["status"] == status
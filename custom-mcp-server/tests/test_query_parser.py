@@ -105,6 +105,20 @@ class TestQueryParser:
             assert parsed is not None
             assert hasattr(parsed, '__call__')
     
+    def test_list_operators_matching(self):
+        """Test that list operators match values and skip missing fields."""
+        in_query = self.parser.parse_query({"status": {"in": ["active", "pending"]}})
+        not_in_query = self.parser.parse_query({"status": {"not_in": ["active", "pending"]}})
+        
+        assert in_query({"status": "active"}) and not not_in_query({"status": "active"})
+        assert not in_query({"status": "done"}) and not_in_query({"status": "done"})
+        assert not in_query({"status": ["active"]}) and not_in_query({"status": ["active"]})
+        assert not in_query({}) and not not_in_query({})
+        
+        # Unhashable list values are still compared by equality
+        nested_query = self.parser.parse_query({"tags": {"in": [["a", "b"], "c"]}})
+        assert nested_query({"tags": ["a", "b"]})
+    
     def test_existence_operators(self):
         """Test parsing existence operators."""
         test_cases = [
@@ -565,4 +579,7 @@ class TestQueryParserIntegration:
         examples = capabilities["syntax_examples"]
         assert "simple_equality" in examples
         assert "logical_and" in examples
-        assert "complex_example" in examples
\ No newline at end of file
+        assert "complex_example" in examples
+        
+        # The static description is built once and reused
+        assert self.db_manager.get_query_capabilities() is capabilities
\ No newline at end of file
@@ -228,6 +228,18 @@ class TestUserTaskFiltering:
         assert len(tasks_by_user[1]) == 3  # Alice's tasks
         assert len(tasks_by_user[2]) == 4  # Bob's tasks
     
+    def test_get_tasks_by_multiple_users_single_user(self):
+        """Test getting tasks for a single user through the multi-user method."""
+        result = self.db_manager.get_tasks_by_multiple_users([2])
+        
+        assert result["success"] is True
+        assert result["count"] == 4
+        assert result["data"]["total_tasks"] == 4
+        assert len(result["data"]["tasks_by_user"][2]) == 4
+        
+        result = self.db_manager.get_tasks_by_multiple_users([2], "pending")
+        assert result["count"] == 2
+    
     def test_get_tasks_by_multiple_users_with_status_filter(self):
         """Test getting tasks for multiple users with status filter."""
         # Get pending tasks for Alice, Bob, and Carol
@@ -304,6 +316,25 @@ class TestUserTaskFiltering:
         # Test with non-existing user
         assert self.db_manager._validate_user_exists(999) is False
     
+    def test_validate_user_exists_cache_invalidated_by_writes(self):
+        """Test that cached existence checks are dropped when users change."""
+        assert self.db_manager._validate_user_exists(5) is False
+        
+        self.db_manager.create_record("users", {"name": "Eve Adams", "email": "eve@example.com"})
+        assert self.db_manager._validate_user_exists(5) is True
+        
+        self.db_manager.delete_records("users", {"id": 5})
+        assert self.db_manager._validate_user_exists(5) is False
+    
+    def test_validate_user_exists_cache_invalidated_by_seeding(self):
+        """Test that a cached missing user is found once sample data adds it."""
+        self.db_manager.initialize_sample_data(force_reset=True)
+        self.db_manager.users.truncate()
+        assert self.db_manager._validate_user_exists(1) is False
+        
+        self.db_manager.initialize_sample_data()
+        assert self.db_manager._validate_user_exists(1) is True
+    
     def test_user_task_filtering_integration(self):
         """Test integration of user task filtering with advanced search."""
         # Test complex query combining user assignment and other criteria